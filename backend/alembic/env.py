@@ -8,10 +8,10 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-# Import Base to get metadata
-from src.database.connection import Base
+# Import the mapper registry to get metadata
+from src.database.connection import mapper_registry
 
-# Import all models so they are registered with Base.metadata
+# Import all models so they are registered with mapper_registry.metadata
 from src.models import (  # noqa: F401
     User,
     HealthMetrics,
@@ -35,7 +35,7 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-target_metadata = Base.metadata
+target_metadata = mapper_registry.metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
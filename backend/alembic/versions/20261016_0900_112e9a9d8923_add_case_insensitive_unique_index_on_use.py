@@ -0,0 +1,61 @@
+"""Add case-insensitive unique index on users email
+
+Revision ID: 112e9a9d8923
+Revises: 4599633c086f
+Create Date: 2026-10-16 09:00:12.418203
+
+The unique build aborts if two users' emails differ only by case, so the
+upgrade checks for such rows first and stops with a list of them to merge or
+rename. A concurrent build that fails part-way leaves an INVALID index behind;
+drop ``ix_users_email_lower`` before retrying.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "112e9a9d8923"
+down_revision: Union[str, None] = "4599633c086f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(email) FROM users "
+                "GROUP BY lower(email) HAVING count(*) > 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add ix_users_email_lower; emails differing only by case: "
+            + ", ".join(duplicates)
+        )
+
+    # CONCURRENTLY cannot run inside a transaction; build without locking users
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_lower",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""Add partial index on Garmin connected users
+
+Revision ID: 5c1e7d2a9b34
+Revises: 112e9a9d8923
+Create Date: 2026-10-16 10:00:41.227915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7d2a9b34"
+down_revision: Union[str, None] = "112e9a9d8923"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build without locking users
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_garmin_connected",
+            "users",
+            ["id"],
+            postgresql_where=sa.text("garmin_access_token IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_garmin_connected",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
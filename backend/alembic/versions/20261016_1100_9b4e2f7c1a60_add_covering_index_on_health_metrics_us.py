@@ -0,0 +1,57 @@
+"""Add covering index on health metrics user and date
+
+Revision ID: 9b4e2f7c1a60
+Revises: 5c1e7d2a9b34
+Create Date: 2026-10-16 11:00:12.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e2f7c1a60"
+down_revision: Union[str, None] = "5c1e7d2a9b34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECOVERY_INPUT_COLUMNS = [
+    "hrv_ms",
+    "resting_hr",
+    "sleep_duration_minutes",
+    "sleep_score",
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build before dropping the
+    # old index so time-series queries always have one to use
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_health_metrics_user_date_cov",
+            "health_metrics",
+            ["user_id", "date"],
+            postgresql_include=RECOVERY_INPUT_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_health_metrics_user_date",
+            table_name="health_metrics",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_health_metrics_user_date",
+            "health_metrics",
+            ["user_id", "date"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_health_metrics_user_date_cov",
+            table_name="health_metrics",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,36 @@
+"""Default recovery score cache timestamps to the database clock
+
+Revision ID: 3d8a6c51f0e2
+Revises: 9b4e2f7c1a60
+Create Date: 2026-10-16 12:00:37.918205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d8a6c51f0e2"
+down_revision: Union[str, None] = "9b4e2f7c1a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "recovery_scores",
+        "cached_at",
+        server_default=sa.text("now()"),
+    )
+    op.alter_column(
+        "recovery_scores",
+        "cache_expires_at",
+        server_default=sa.text("now() + interval '24 hours'"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column("recovery_scores", "cache_expires_at", server_default=None)
+    op.alter_column("recovery_scores", "cached_at", server_default=None)
@@ -0,0 +1,50 @@
+"""Add covering index on workouts user and date
+
+Revision ID: c27f9e4b8d15
+Revises: 3d8a6c51f0e2
+Create Date: 2026-10-16 13:00:05.482716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c27f9e4b8d15"
+down_revision: Union[str, None] = "3d8a6c51f0e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build before dropping the
+    # old index so time-series queries always have one to use
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workouts_user_date_load",
+            "workouts",
+            ["user_id", "date"],
+            postgresql_include=["training_load"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_workouts_user_date",
+            table_name="workouts",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workouts_user_date",
+            "workouts",
+            ["user_id", "date"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_workouts_user_date_load",
+            table_name="workouts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""Replace planned workout completion index with a pending partial index
+
+Revision ID: e85b1d3a6f47
+Revises: c27f9e4b8d15
+Create Date: 2026-10-16 14:00:21.775094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e85b1d3a6f47"
+down_revision: Union[str, None] = "c27f9e4b8d15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; avoid locking the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_planned_workouts_pending",
+            "planned_workouts",
+            ["training_plan_id", "scheduled_date"],
+            postgresql_where=sa.text("is_completed = false AND skipped = false"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_planned_workouts_completion",
+            table_name="planned_workouts",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_planned_workouts_completion",
+            "planned_workouts",
+            ["is_completed"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_planned_workouts_pending",
+            table_name="planned_workouts",
+            postgresql_concurrently=True,
+        )
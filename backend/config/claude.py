@@ -1,47 +1,102 @@
 """Claude AI configuration."""
 
 import os
-
-
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# System prompts per task type
+_PROMPTS: Mapping[str, str] = MappingProxyType(
+    {
+        "insight": (
+            "You are an expert sports scientist and training advisor. "
+            "Analyze the provided health and training data to generate "
+            "actionable insights. Focus on patterns, trends, and specific "
+            "recommendations for improvement. Be concise and clear."
+        ),
+        "recommendation": (
+            "You are an expert endurance coach specializing in personalized "
+            "training recommendations. Based on the recovery score and recent "
+            "training history, recommend an appropriate workout for today. "
+            "Include workout type, intensity, duration, and clear rationale."
+        ),
+        "plan": (
+            "You are an expert training plan designer. Create a structured "
+            "multi-week training plan that progresses appropriately, includes "
+            "recovery periods, and aligns with the athlete's goals. Balance "
+            "volume, intensity, and recovery."
+        ),
+        "adjustment": (
+            "You are an expert at adaptive training planning. Analyze the "
+            "athlete's actual performance versus planned workouts and adjust "
+            "the upcoming training plan accordingly. Maintain progression "
+            "while respecting recovery needs."
+        ),
+    }
+)
+_DEFAULT_PROMPT = "You are a helpful AI assistant specialized in sports training and health optimization."
+
+# Task types routed to Haiku when use_haiku_for_simple_tasks is enabled
+_SIMPLE_TASKS = frozenset({"insight", "recommendation"})
+
+
+@dataclass(frozen=True)
 class ClaudeConfig:
     """Configuration for Anthropic Claude AI integration."""
 
-    def __init__(self):
-        """Initialize Claude configuration from environment."""
-        self.api_key: str = os.getenv("ANTHROPIC_API_KEY", "")
+    api_key: str = field(default="", repr=False)
 
-        # Model configuration
-        self.model: str = os.getenv("CLAUDE_MODEL", "claude-haiku-4.5")
+    # Model configuration
+    model: str = "claude-haiku-4.5"
 
-        # API configuration
-        self.api_version: str = "2023-06-01"
-        self.base_url: str = "https://api.anthropic.com"
+    # API configuration
+    api_version: str = "2023-06-01"
+    base_url: str = "https://api.anthropic.com"
 
-        # Request configuration
-        self.max_tokens: int = int(os.getenv("CLAUDE_MAX_TOKENS", "1024"))
-        self.temperature: float = float(os.getenv("CLAUDE_TEMPERATURE", "0.7"))
-        self.timeout: int = int(os.getenv("CLAUDE_TIMEOUT", "60"))
+    # Request configuration
+    max_tokens: int = 1024
+    temperature: float = 0.7
+    timeout: int = 60
 
-        # Retry configuration
-        self.max_retries: int = 3
-        self.retry_delay: int = 5  # seconds
+    # Retry configuration
+    max_retries: int = 3
+    retry_delay: int = 5  # seconds
 
-        # Prompt caching configuration
-        self.enable_prompt_caching: bool = (
-            os.getenv("CLAUDE_ENABLE_CACHING", "true").lower() == "true"
-        )
-        self.cache_ttl: int = 3600  # 1 hour in seconds
+    # Prompt caching configuration
+    enable_prompt_caching: bool = True
+    cache_ttl: int = 3600  # 1 hour in seconds
 
-        # Batch processing configuration
-        self.enable_batch_processing: bool = (
-            os.getenv("CLAUDE_ENABLE_BATCH", "true").lower() == "true"
-        )
-        self.batch_size: int = int(os.getenv("CLAUDE_BATCH_SIZE", "10"))
+    # Batch processing configuration
+    enable_batch_processing: bool = True
+    batch_size: int = 10
 
-        # Cost optimization
-        self.use_haiku_for_simple_tasks: bool = (
-            os.getenv("CLAUDE_USE_HAIKU", "true").lower() == "true"
-        )
+    # Cost optimization
+    use_haiku_for_simple_tasks: bool = True
+
+    # Per-task request parameters, precomputed in __post_init__
+    _request_params: Mapping[str, Mapping[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute request parameters for each known task type."""
+        request_params = {}
+        for task_type in (*_PROMPTS, "default"):
+            # Use Haiku for simpler tasks if enabled
+            model = self.model
+            if self.use_haiku_for_simple_tasks and task_type in _SIMPLE_TASKS:
+                model = "claude-haiku-4.5"
+
+            request_params[task_type] = MappingProxyType(
+                {
+                    "model": model,
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature,
+                }
+            )
+
+        object.__setattr__(self, "_request_params", MappingProxyType(request_params))
 
     def validate(self) -> bool:
         """Validate that required configuration is present."""
@@ -58,61 +113,49 @@ class ClaudeConfig:
         Returns:
             System prompt optimized for the task
         """
-        prompts = {
-            "insight": (
-                "You are an expert sports scientist and training advisor. "
-                "Analyze the provided health and training data to generate "
-                "actionable insights. Focus on patterns, trends, and specific "
-                "recommendations for improvement. Be concise and clear."
-            ),
-            "recommendation": (
-                "You are an expert endurance coach specializing in personalized "
-                "training recommendations. Based on the recovery score and recent "
-                "training history, recommend an appropriate workout for today. "
-                "Include workout type, intensity, duration, and clear rationale."
-            ),
-            "plan": (
-                "You are an expert training plan designer. Create a structured "
-                "multi-week training plan that progresses appropriately, includes "
-                "recovery periods, and aligns with the athlete's goals. Balance "
-                "volume, intensity, and recovery."
-            ),
-            "adjustment": (
-                "You are an expert at adaptive training planning. Analyze the "
-                "athlete's actual performance versus planned workouts and adjust "
-                "the upcoming training plan accordingly. Maintain progression "
-                "while respecting recovery needs."
-            ),
-        }
-
-        return prompts.get(
-            task_type,
-            "You are a helpful AI assistant specialized in sports training and health optimization.",
-        )
-
-    def get_request_params(self, task_type: str) -> dict:
+        return _PROMPTS.get(task_type, _DEFAULT_PROMPT)
+
+    def get_request_params(self, task_type: str) -> Mapping[str, Any]:
         """Get optimized request parameters for task type.
 
         Args:
             task_type: Type of task
 
         Returns:
-            Dictionary of request parameters
+            Read-only mapping of request parameters
         """
-        # Use Haiku for simpler tasks if enabled
-        model = self.model
-        if self.use_haiku_for_simple_tasks and task_type in [
-            "insight",
-            "recommendation",
-        ]:
-            model = "claude-haiku-4.5"
-
-        return {
-            "model": model,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-        }
-
-
-# Global configuration instance
-claude_config = ClaudeConfig()
+        return self._request_params.get(task_type, self._request_params["default"])
+
+
+@lru_cache(maxsize=1)
+def get_claude_config() -> ClaudeConfig:
+    """Get cached Claude configuration parsed once from the environment.
+
+    Returns:
+        ClaudeConfig: Claude configuration
+    """
+    return ClaudeConfig(
+        api_key=os.getenv("ANTHROPIC_API_KEY", ""),
+        model=os.getenv("CLAUDE_MODEL", "claude-haiku-4.5"),
+        max_tokens=int(os.getenv("CLAUDE_MAX_TOKENS", "1024")),
+        temperature=float(os.getenv("CLAUDE_TEMPERATURE", "0.7")),
+        timeout=int(os.getenv("CLAUDE_TIMEOUT", "60")),
+        enable_prompt_caching=(
+            os.getenv("CLAUDE_ENABLE_CACHING", "true").lower() == "true"
+        ),
+        enable_batch_processing=(
+            os.getenv("CLAUDE_ENABLE_BATCH", "true").lower() == "true"
+        ),
+        batch_size=int(os.getenv("CLAUDE_BATCH_SIZE", "10")),
+        use_haiku_for_simple_tasks=(
+            os.getenv("CLAUDE_USE_HAIKU", "true").lower() == "true"
+        ),
+    )
+
+
+def __getattr__(name: str):
+    """Build the global ``claude_config`` lazily on first access (PEP 562)."""
+    if name == "claude_config":
+        globals()[name] = get_claude_config()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,45 +1,52 @@
 """Garmin OAuth configuration."""
 
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import quote, urlencode
 
 
+@dataclass(frozen=True)
 class GarminConfig:
     """Configuration for Garmin Connect API integration."""
 
-    def __init__(self):
-        """Initialize Garmin configuration from environment."""
-        self.client_id: str = os.getenv("GARMIN_CLIENT_ID", "")
-        self.client_secret: str = os.getenv("GARMIN_CLIENT_SECRET", "")
-        self.redirect_uri: str = os.getenv(
-            "GARMIN_REDIRECT_URI", "http://localhost:8000/api/v1/garmin/callback"
-        )
+    client_id: str = ""
+    client_secret: str = field(default="", repr=False)
+    redirect_uri: str = "http://localhost:8000/api/v1/garmin/callback"
+
+    # OAuth 2.0 PKCE endpoints
+    authorization_endpoint: str = "https://connect.garmin.com/oauthConfirm"
+    token_endpoint: str = (
+        "https://connectapi.garmin.com/oauth-service/oauth/access_token"
+    )
 
-        # OAuth 2.0 PKCE endpoints
-        self.authorization_endpoint: str = "https://connect.garmin.com/oauthConfirm"
-        self.token_endpoint: str = (
-            "https://connectapi.garmin.com/oauth-service/oauth/access_token"
-        )
+    # API base URL
+    api_base_url: str = "https://apis.garmin.com"
 
-        # API base URL
-        self.api_base_url: str = "https://apis.garmin.com"
+    # Scopes required for health and workout data
+    scopes: tuple[str, ...] = (
+        "garmin:activities_read",
+        "garmin:health_read",
+        "garmin:sleep_read",
+        "garmin:hrv_read",
+    )
 
-        # Scopes required for health and workout data
-        self.scopes: list[str] = [
-            "garmin:activities_read",
-            "garmin:health_read",
-            "garmin:sleep_read",
-            "garmin:hrv_read",
-        ]
+    # Request timeout (seconds)
+    timeout: int = 30
 
-        # Request timeout (seconds)
-        self.timeout: int = int(os.getenv("GARMIN_TIMEOUT", "30"))
+    # Cache TTL for Garmin data (24 hours in seconds)
+    cache_ttl: int = 86400
 
-        # Cache TTL for Garmin data (24 hours in seconds)
-        self.cache_ttl: int = 86400
+    # Retry configuration
+    max_retries: int = 3
+    retry_delay: int = 60  # seconds
 
-        # Retry configuration
-        self.max_retries: int = 3
-        self.retry_delay: int = 60  # seconds
+    # Space-separated scope string, precomputed in __post_init__
+    _scopes_joined: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Join scopes once for authorization URLs."""
+        object.__setattr__(self, "_scopes_joined", " ".join(self.scopes))
 
     def validate(self) -> bool:
         """Validate that required configuration is present."""
@@ -62,13 +69,33 @@ class GarminConfig:
             "client_id": self.client_id,
             "redirect_uri": self.redirect_uri,
             "response_type": "code",
-            "scope": " ".join(self.scopes),
+            "scope": self._scopes_joined,
             "state": state,
         }
 
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{self.authorization_endpoint}?{query_string}"
+        return f"{self.authorization_endpoint}?{urlencode(params, quote_via=quote)}"
+
+
+@lru_cache(maxsize=1)
+def get_garmin_config() -> GarminConfig:
+    """Get cached Garmin configuration parsed once from the environment.
+
+    Returns:
+        GarminConfig: Garmin configuration
+    """
+    return GarminConfig(
+        client_id=os.getenv("GARMIN_CLIENT_ID", ""),
+        client_secret=os.getenv("GARMIN_CLIENT_SECRET", ""),
+        redirect_uri=os.getenv(
+            "GARMIN_REDIRECT_URI", "http://localhost:8000/api/v1/garmin/callback"
+        ),
+        timeout=int(os.getenv("GARMIN_TIMEOUT", "30")),
+    )
 
 
-# Global configuration instance
-garmin_config = GarminConfig()
+def __getattr__(name: str):
+    """Build the global ``garmin_config`` lazily on first access (PEP 562)."""
+    if name == "garmin_config":
+        globals()[name] = get_garmin_config()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,8 +13,11 @@ else:
 # API endpoint
 API_URL = "http://localhost:8000/api/v1/garmin"
 
-# Headers with auth token
-headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+# Shared session so connections are reused across API calls
+session = requests.Session()
+session.headers.update(
+    {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+)
 
 print("\n" + "=" * 60)
 print("🔗 GARMIN OAUTH CONNECTION")
@@ -23,7 +26,7 @@ print("\nInitiating Garmin authorization...")
 
 try:
     # Call authorize endpoint
-    response = requests.post(f"{API_URL}/authorize", headers=headers)
+    response = session.post(f"{API_URL}/authorize")
 
     if response.status_code == 200:
         data = response.json()
@@ -1,7 +1,7 @@
 """Generate JWT token for test user."""
 import sys
-from datetime import datetime, timedelta
-from jose import jwt
+from datetime import datetime, timedelta, timezone
+import jwt
 
 # JWT settings from .env
 SECRET_KEY = "your-jwt-secret-change-in-production"
@@ -16,8 +16,8 @@ else:
     sys.exit(1)
 
 # Create token
-expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-to_encode = {"sub": user_id, "exp": expire, "type": "access"}
+expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+to_encode = {"sub": user_id, "exp": int(expire.timestamp()), "type": "access"}
 
 token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
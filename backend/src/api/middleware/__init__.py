@@ -0,0 +1,16 @@
+"""API middleware."""
+from .auth import (
+    JWTBearer,
+    get_current_user,
+    get_current_user_id,
+    invalidate_cached_user,
+    jwt_bearer,
+)
+
+__all__ = [
+    "JWTBearer",
+    "get_current_user",
+    "get_current_user_id",
+    "invalidate_cached_user",
+    "jwt_bearer",
+]
@@ -1,24 +1,54 @@
 """JWT authentication middleware."""
 
 import os
-from typing import Optional
-
-from jose import jwt, JWTError
+import sys
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from src.database.connection import get_sync_db_session
+from src.database.connection import AsyncSessionLocal
 from src.models.user import User
 
 
+# JWT verification settings, read once at import
+_JWT_SECRET = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-me")
+_JWT_ALG = "HS256"
+_JWT_ALGS = [_JWT_ALG]
+
+# Short-lived cache of detached users so repeat requests skip the DB
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10_000
+_user_cache: Dict[uuid.UUID, Tuple[float, User]] = {}
+_user_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str) -> dict:
+    """Verify a JWT signature and memoize its payload per token.
+
+    Only successful decodes are cached; invalid tokens raise every time.
+    Expiry is not re-checked here, see JWTBearer._decode.
+    """
+    return jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern string claims so repeated keys hash and compare by identity."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class JWTBearer(HTTPBearer):
     """JWT Bearer token authentication."""
 
     def __init__(self, auto_error: bool = True):
         """Initialize JWT Bearer."""
         super().__init__(auto_error=auto_error)
-        self.secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-me")
-        self.algorithm = "HS256"
 
     async def __call__(
         self, request: Request
@@ -36,19 +66,10 @@ class JWTBearer(HTTPBearer):
                 )
 
             token = credentials.credentials
-            if not self.verify_jwt(token):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Invalid token or expired token.",
-                )
 
-            # Decode and attach user info to request state
+            # Decode once and attach user info to request state
             try:
-                payload = jwt.decode(
-                    token, self.secret_key, algorithms=[self.algorithm]
-                )
-                request.state.user_id = payload.get("user_id")
-                request.state.email = payload.get("email")
+                payload = self._decode(token)
             except jwt.ExpiredSignatureError:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -57,28 +78,44 @@ class JWTBearer(HTTPBearer):
             except jwt.InvalidTokenError:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Invalid token.",
+                    detail="Invalid token or expired token.",
                 )
 
+            # Keep the decoded payload so downstream dependencies never re-decode;
+            # user ID comes from 'sub' (standard JWT) or falls back to 'user_id'
+            request.state.jwt_payload = payload
+            request.state.user_id, request.state.email = (
+                _intern(payload.get("sub") or payload.get("user_id")),
+                _intern(payload.get("email")),
+            )
+
             return credentials
 
         return None
 
-    def verify_jwt(self, token: str) -> bool:
-        """Verify JWT token."""
-        try:
-            jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return True
-        except JWTError:
-            return False
+    def _decode(self, token: str) -> dict:
+        """Decode a JWT, reusing the cached signature check.
+
+        Returns a shallow copy of the cached payload, so callers that edit it
+        cannot change the claims seen by later requests with the same token.
+
+        Raises:
+            jwt.ExpiredSignatureError: If the token has expired
+            jwt.InvalidTokenError: If the token is invalid
+        """
+        payload = _decode_cached(token)
+
+        # Cached payloads skip jwt.decode, so expiry must be enforced here
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired.")
+
+        return dict(payload)
 
     def decode_jwt(self, token: str) -> Optional[dict]:
         """Decode JWT token."""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
-        except jwt.ExpiredSignatureError:
-            return None
+            return self._decode(token)
         except jwt.InvalidTokenError:
             return None
 
@@ -98,7 +135,39 @@ def get_current_user_id(request: Request) -> str:
     return user_id
 
 
-def get_current_user(
+def _get_cached_user(user_id: uuid.UUID) -> Optional[User]:
+    """Return a cached user if its entry has not expired."""
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del _user_cache[user_id]
+            return None
+
+        return user
+
+
+def _cache_user(user: User) -> None:
+    """Store a detached user, evicting the oldest entry when full."""
+    with _user_cache_lock:
+        _user_cache.pop(user.id, None)
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del _user_cache[next(iter(_user_cache))]
+        _user_cache[user.id] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+
+
+def invalidate_cached_user(user_id: uuid.UUID) -> None:
+    """Drop a user from the cache after it has been modified."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(jwt_bearer),
 ) -> User:
     """
@@ -108,7 +177,7 @@ def get_current_user(
 
     Usage:
         @app.get("/protected")
-        def protected_route(user: User = Depends(get_current_user)):
+        async def protected_route(user: User = Depends(get_current_user)):
             return {"user_id": user.id}
     """
     if not credentials:
@@ -117,25 +186,22 @@ def get_current_user(
             detail="Not authenticated",
         )
 
-    # Decode token to get user_id
-    payload = jwt_bearer.decode_jwt(credentials.credentials)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        )
-
-    # Get user ID from 'sub' field (standard JWT) or fall back to 'user_id'
-    user_id = payload.get("sub") or payload.get("user_id")
-    if not user_id:
+    # User ID was already extracted when jwt_bearer decoded the token
+    try:
+        user_id = uuid.UUID(str(getattr(request.state, "user_id", None)))
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
 
-    # Fetch user from database
-    with get_sync_db_session() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+    user = _get_cached_user(user_id)
+    if user is not None:
+        return user
+
+    # Fetch user from database by primary key
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -144,4 +210,6 @@ def get_current_user(
 
         # Detach from session so it can be used outside the context
         db.expunge(user)
-        return user
+
+    _cache_user(user)
+    return user
@@ -1,79 +1,90 @@
-"""Error handling middleware."""
+"""Error handling for application exceptions."""
 
 import logging
-from typing import Callable
 
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlingMiddleware:
-    """Middleware for handling application errors."""
-
-    def __init__(self, app):
-        """Initialize error handling middleware."""
-        self.app = app
-
-    async def __call__(self, request: Request, call_next: Callable) -> Response:
-        """Process request and handle errors."""
-        try:
-            response = await call_next(request)
-            return response
-
-        except IntegrityError as exc:
-            logger.error(f"Database integrity error: {exc}")
-            return JSONResponse(
-                status_code=status.HTTP_409_CONFLICT,
-                content={
-                    "detail": "Resource conflict. This record may already exist.",
-                    "type": "integrity_error",
-                },
-            )
-
-        except SQLAlchemyError as exc:
-            logger.error(f"Database error: {exc}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "Database error occurred.",
-                    "type": "database_error",
-                },
-            )
-
-        except ValueError as exc:
-            logger.warning(f"Validation error: {exc}")
-            return JSONResponse(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                content={
-                    "detail": str(exc),
-                    "type": "validation_error",
-                },
-            )
-
-        except PermissionError as exc:
-            logger.warning(f"Permission denied: {exc}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "detail": "Permission denied.",
-                    "type": "permission_error",
-                },
-            )
-
-        except Exception as exc:
-            logger.exception(f"Unhandled error: {exc}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "An unexpected error occurred.",
-                    "type": "internal_error",
-                },
-            )
-
-
-def setup_error_handling(app):
-    """Add error handling middleware to FastAPI app."""
-    app.add_middleware(ErrorHandlingMiddleware)
+async def _integrity_error_handler(
+    request: Request, exc: IntegrityError
+) -> ORJSONResponse:
+    """Handle database integrity errors."""
+    logger.error(f"Database integrity error: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "detail": "Resource conflict. This record may already exist.",
+            "type": "integrity_error",
+        },
+    )
+
+
+async def _database_error_handler(
+    request: Request, exc: SQLAlchemyError
+) -> ORJSONResponse:
+    """Handle generic database errors."""
+    logger.error(f"Database error: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "detail": "Database error occurred.",
+            "type": "database_error",
+        },
+    )
+
+
+async def _validation_error_handler(
+    request: Request, exc: ValueError
+) -> ORJSONResponse:
+    """Handle validation errors raised as ValueError."""
+    logger.warning(f"Validation error: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={
+            "detail": str(exc),
+            "type": "validation_error",
+        },
+    )
+
+
+async def _permission_error_handler(
+    request: Request, exc: PermissionError
+) -> ORJSONResponse:
+    """Handle permission errors."""
+    logger.warning(f"Permission denied: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_403_FORBIDDEN,
+        content={
+            "detail": "Permission denied.",
+            "type": "permission_error",
+        },
+    )
+
+
+async def _unhandled_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle any exception not matched by a more specific handler."""
+    logger.exception(f"Unhandled error: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "detail": "An unexpected error occurred.",
+            "type": "internal_error",
+        },
+    )
+
+
+def setup_error_handling(app: FastAPI) -> None:
+    """Register exception handlers on the FastAPI app.
+
+    Starlette dispatches on the most specific matching exception class and
+    only when an exception is raised, so successful requests pay nothing.
+    """
+    app.add_exception_handler(IntegrityError, _integrity_error_handler)
+    app.add_exception_handler(SQLAlchemyError, _database_error_handler)
+    app.add_exception_handler(ValueError, _validation_error_handler)
+    app.add_exception_handler(PermissionError, _permission_error_handler)
+    app.add_exception_handler(Exception, _unhandled_error_handler)
@@ -1,25 +1,89 @@
 """Authentication routes."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.auth import (
     UserRegisterRequest,
     UserLoginRequest,
     UserWithTokensResponse,
-    UserResponse,
 )
 from src.database.connection import get_async_session
 from src.models.user import User
 from src.services.jwt_service import JWTService
 from src.services.password_service import PasswordService
-from sqlalchemy import select
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import lazyload
 
 router = APIRouter()
 jwt_service = JWTService()
 password_service = PasswordService()
 
 
+def _invalid_credentials() -> HTTPException:
+    """Build the login failure error.
+
+    A fresh instance per raise: re-raising one shared exception would chain
+    every raise's frames (and their plaintext passwords) onto its traceback.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid email or password",
+    )
+
+
+def _account_deactivated() -> HTTPException:
+    """Build the deactivated-account login error (fresh instance per raise)."""
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Account is deactivated",
+    )
+
+
+# Dedicated pool for CPU-bound password hashing so it never blocks the event
+# loop; capped at the CPU count to avoid oversubscribing cores
+_pw_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+)
+
+
+def _user_with_tokens_response(
+    user: User,
+    access_token: str,
+    refresh_token: str,
+    status_code: int = status.HTTP_200_OK,
+) -> ORJSONResponse:
+    """Serialize a UserWithTokensResponse payload straight to JSON.
+
+    The user fields come from the database row and the tokens were just
+    issued, so the payload is handed to orjson as a plain dict, skipping
+    Pydantic model construction and response_model re-validation.
+    response_model on the routes still documents the schema.
+    """
+    return ORJSONResponse(
+        {
+            "user": {
+                "id": user.id,
+                "email": user.email,
+                "full_name": user.full_name,
+                "is_active": user.is_active,
+                "is_verified": user.is_verified,
+                "is_garmin_connected": user.is_garmin_connected,
+                "created_at": user.created_at,
+            },
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+        },
+        status_code=status_code,
+    )
+
+
 @router.post(
     "/register",
     response_model=UserWithTokensResponse,
@@ -41,39 +105,49 @@ async def register(
     Raises:
         HTTPException: If email already exists
     """
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email.lower()))
-    existing_user = result.scalar_one_or_none()
+    email = user_data.email.lower()
 
-    if existing_user:
+    # Check if user already exists (matches ix_users_email_lower, no ORM load)
+    result = await db.execute(
+        select(literal(1)).where(func.lower(User.email) == email).limit(1)
+    )
+
+    if result.scalar() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
     # Create new user
-    hashed_password = password_service.hash_password(user_data.password)
-    new_user = User(
-        email=user_data.email.lower(),
-        hashed_password=hashed_password,
-        full_name=user_data.full_name,
-        is_active=True,
-        is_verified=False,
+    hashed_password = await asyncio.get_running_loop().run_in_executor(
+        _pw_pool, password_service.hash_password, user_data.password
     )
-
-    db.add(new_user)
+    # RETURNING hands back the persisted row in the INSERT round-trip, so no
+    # refresh SELECT is needed; relationships are left unloaded
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=email,
+            hashed_password=hashed_password,
+            full_name=user_data.full_name,
+            is_active=True,
+            is_verified=False,
+        )
+        .returning(User)
+        .options(lazyload("*"))
+    )
+    new_user = result.scalar_one()
     await db.commit()
-    await db.refresh(new_user)
 
     # Generate tokens
     access_token = jwt_service.create_access_token(user_id=new_user.id)
     refresh_token = jwt_service.create_refresh_token(user_id=new_user.id)
 
-    return UserWithTokensResponse(
-        user=UserResponse.model_validate(new_user),
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
+    return _user_with_tokens_response(
+        new_user,
+        access_token,
+        refresh_token,
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -96,37 +170,34 @@ async def login(
     """
     # Find user by email
     result = await db.execute(
-        select(User).where(User.email == credentials.email.lower())
+        select(User).where(func.lower(User.email) == credentials.email.lower()).limit(1)
     )
     user = result.scalar_one_or_none()
 
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid email or password",
-        )
-
-    # Verify password
-    if not password_service.verify_password(credentials.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid email or password",
-        )
+        raise _invalid_credentials()
+
+    # Verify password (also rehashes legacy bcrypt hashes with Argon2id)
+    password_valid, new_hash = await asyncio.get_running_loop().run_in_executor(
+        _pw_pool,
+        password_service.verify_and_update,
+        credentials.password,
+        user.hashed_password,
+    )
+    if not password_valid:
+        raise _invalid_credentials()
 
     # Check if account is active
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Account is deactivated",
-        )
+        raise _account_deactivated()
+
+    # Store the upgraded hash so the legacy one is only verified once
+    if new_hash is not None:
+        user.hashed_password = new_hash
+        await db.commit()
 
     # Generate tokens
     access_token = jwt_service.create_access_token(user_id=user.id)
     refresh_token = jwt_service.create_refresh_token(user_id=user.id)
 
-    return UserWithTokensResponse(
-        user=UserResponse.model_validate(user),
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-    )
+    return _user_with_tokens_response(user, access_token, refresh_token)
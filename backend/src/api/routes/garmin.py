@@ -8,32 +8,75 @@ Handles OAuth2 PKCE authorization flow with Garmin Connect:
 4. POST /sync - Trigger manual data sync
 """
 
+import uuid
+from functools import lru_cache
+
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
+from redis.asyncio import Redis
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from typing import Optional
 
 from src.database.connection import get_db
 from src.models.user import User
-from src.api.middleware.auth import get_current_user
+from src.database.redis import get_redis
+from src.api.middleware.auth import (
+    get_current_user,
+    get_current_user_id,
+    invalidate_cached_user,
+    jwt_bearer,
+)
 from src.services.garmin.oauth_service import GarminOAuthService
-from src.config.settings import settings
+from src.config.settings import get_settings
 from src.utils.encryption import encrypt_token
 
 router = APIRouter()
 
+# Garmin connection status cache (Redis, per user)
+GARMIN_STATUS_CACHE_PREFIX = "garmin_status"
+GARMIN_STATUS_CACHE_TTL_SECONDS = 30
 
-# OAuth service instance
-def get_oauth_service() -> GarminOAuthService:
-    """Dependency for Garmin OAuth service."""
+
+def _garmin_status_key(user_id: object) -> str:
+    """Build the Redis key caching a user's Garmin connection status."""
+    return f"{GARMIN_STATUS_CACHE_PREFIX}:{user_id}"
+
+
+# Pooled HTTP/2 client shared by every token exchange from this process, so
+# keep-alive amortizes the TLS handshake to Garmin across callbacks
+_oauth_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_cached_oauth_service() -> GarminOAuthService:
+    """Build the OAuth service once; its configuration never changes."""
+    settings = get_settings()
     return GarminOAuthService(
         client_id=settings.garmin_client_id,
         client_secret=settings.garmin_client_secret,
         redirect_uri=settings.garmin_callback_url,
+        http_client=_oauth_http_client,
     )
 
 
+async def get_oauth_service() -> GarminOAuthService:
+    """Dependency for Garmin OAuth service."""
+    return _get_cached_oauth_service()
+
+
+async def close_oauth_http_client() -> None:
+    """Close the shared OAuth HTTP client (called on application shutdown)."""
+    await _oauth_http_client.aclose()
+
+
 @router.post("/authorize", status_code=status.HTTP_200_OK)
 async def initiate_authorization(
     current_user: User = Depends(get_current_user),
@@ -73,6 +116,7 @@ async def handle_oauth_callback(
     current_user: User = Depends(get_current_user),
     oauth_service: GarminOAuthService = Depends(get_oauth_service),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Handle OAuth callback from Garmin.
@@ -109,16 +153,23 @@ async def handle_oauth_callback(
         encrypted_refresh_token = encrypt_token(refresh_token)
 
         # Update user with Garmin credentials
-        current_user.garmin_user_id = garmin_user_id
-        current_user.garmin_access_token = encrypted_access_token
-        current_user.garmin_refresh_token = encrypted_refresh_token
-        current_user.garmin_token_expires_at = token_expires_at
-
+        await db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(
+                garmin_user_id=garmin_user_id,
+                garmin_access_token=encrypted_access_token,
+                garmin_refresh_token=encrypted_refresh_token,
+                garmin_token_expires_at=token_expires_at,
+            )
+        )
         await db.commit()
+        invalidate_cached_user(current_user.id)
+        await redis.delete(_garmin_status_key(current_user.id))
 
         # Redirect to frontend success page
         return RedirectResponse(
-            url=f"{settings.FRONTEND_URL}/settings/garmin/success",
+            url=f"{get_settings().frontend_url}/settings/garmin/success",
             status_code=status.HTTP_302_FOUND,
         )
 
@@ -132,7 +183,9 @@ async def handle_oauth_callback(
 
 @router.post("/disconnect", status_code=status.HTTP_200_OK)
 async def disconnect_garmin(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Disconnect Garmin account by removing stored tokens.
@@ -141,12 +194,19 @@ async def disconnect_garmin(
         Success message
     """
     # Clear Garmin credentials
-    current_user.garmin_user_id = None
-    current_user.garmin_access_token = None
-    current_user.garmin_refresh_token = None
-    current_user.garmin_token_expires_at = None
-
+    await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(
+            garmin_user_id=None,
+            garmin_access_token=None,
+            garmin_refresh_token=None,
+            garmin_token_expires_at=None,
+        )
+    )
     await db.commit()
+    invalidate_cached_user(current_user.id)
+    await redis.delete(_garmin_status_key(current_user.id))
 
     return {"message": "Garmin account disconnected successfully"}
 
@@ -187,19 +247,59 @@ async def trigger_manual_sync(
     return {"message": "Sync job queued", "job_id": job.id, "sync_date": sync_date}
 
 
-@router.get("/status", status_code=status.HTTP_200_OK)
-async def get_garmin_status(current_user: User = Depends(get_current_user)):
+@router.get(
+    "/status", status_code=status.HTTP_200_OK, dependencies=[Depends(jwt_bearer)]
+)
+async def get_garmin_status(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
     """
     Get Garmin connection status for current user.
 
+    Served from a short-lived Redis entry when possible, since clients poll
+    this endpoint; only the three Garmin columns are read on a miss.
+
     Returns:
         Connection status and last sync information
     """
-    is_connected = current_user.garmin_access_token is not None
+    cache_key = _garmin_status_key(user_id)
+    cached = await redis.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
 
-    return {
-        "connected": is_connected,
-        "garmin_user_id": current_user.garmin_user_id,
-        "token_expires_at": current_user.garmin_token_expires_at,
+    try:
+        user_uuid = uuid.UUID(str(user_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+
+    result = await db.execute(
+        select(
+            User.garmin_user_id,
+            User.garmin_access_token.is_not(None).label("connected"),
+            User.garmin_token_expires_at,
+        ).where(User.id == user_uuid)
+    )
+    row = result.first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    garmin_status = {
+        "connected": row.connected,
+        "garmin_user_id": row.garmin_user_id,
+        "token_expires_at": row.garmin_token_expires_at,
         "last_synced": None,  # TODO: Track last sync timestamp
     }
+    await redis.set(
+        cache_key, orjson.dumps(garmin_status), ex=GARMIN_STATUS_CACHE_TTL_SECONDS
+    )
+
+    return garmin_status
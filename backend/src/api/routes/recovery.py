@@ -1,11 +1,28 @@
 """Recovery and recommendations routes."""
-from datetime import date as date_type, datetime, timedelta
-from typing import List, Dict
+import time
+import uuid
+from datetime import date as date_type, datetime, timedelta, timezone
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    String,
+    cast,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.connection import get_db
+from src.config.settings import get_settings
+from src.database.connection import get_async_session
+from src.database.redis import get_redis
 from src.models.user import User
 from src.models.recovery_score import RecoveryScore
 from src.models.workout import Workout
@@ -18,6 +35,8 @@ from src.api.schemas.recovery import (
     AlternativeWorkout,
     WorkoutDetails,
     ComponentScores,
+    INTENSITY_LEVELS,
+    STATUS_COLORS,
 )
 from src.services.recommendations import (
     IntensityMapper,
@@ -26,76 +45,199 @@ from src.services.recommendations import (
     AlternativesService,
     OvertrainingPrevention,
 )
-from src.jobs.recovery_score import calculate_user_recovery_score
+from src.jobs.recovery_score import (
+    RECOVERY_SCORE_VERSION_TTL_SECONDS,
+    calculate_user_recovery_score,
+    recovery_score_cache_key,
+    recovery_score_version_key,
+)
 
 router = APIRouter()
 
-# Rate limiting for recalculation (in-memory, simple implementation)
-_recalculation_cooldown: Dict[str, datetime] = {}
+# Responses are built with model_construct, which skips the schema's
+# validators; in debug mode the enum-like fields are checked here instead
+_CHECK_RESPONSE_VALUES = get_settings().debug
+
+
+def _check_response_value(value: str, allowed: object, field: str) -> None:
+    """In debug mode, reject a value the response schema does not allow."""
+    if _CHECK_RESPONSE_VALUES and value not in allowed:
+        raise ValueError(f"Invalid {field} for response: {value!r}")
+
+
+# Rate limiting for recalculation (Redis-backed, shared across workers)
+RECALCULATION_COOLDOWN_PREFIX = "recovery:recalc_cooldown"
 RECALCULATION_COOLDOWN_SECONDS = 300  # 5 minutes
 
+# Claims the cooldown key, or returns the seconds left on an existing one, in a
+# single server-side step (0 means the caller now holds the cooldown)
+_CLAIM_COOLDOWN_LUA = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+return math.max(redis.call('TTL', KEYS[1]), 1)
+"""
+_claim_cooldown_script: Optional[AsyncScript] = None
+
+
+async def _claim_cooldown(redis: Redis, key: str) -> int:
+    """Claim a recalculation cooldown; return seconds remaining if already held.
+
+    The script is sent once and invoked by SHA afterwards (EVALSHA), so each
+    check is one round-trip whether or not the cooldown is free.
+    """
+    global _claim_cooldown_script
+    if _claim_cooldown_script is None:
+        _claim_cooldown_script = redis.register_script(_CLAIM_COOLDOWN_LUA)
+    return await _claim_cooldown_script(
+        keys=[key], args=[RECALCULATION_COOLDOWN_SECONDS], client=redis
+    )
+
+
+def _parse_date_param(value: str) -> date_type:
+    """Parse a YYYY-MM-DD path parameter, raising 400 on bad input.
+
+    date.fromisoformat is implemented in C by the datetime module, so it is
+    already the fast path; ciso8601 would also accept full timestamps here.
+    """
+    try:
+        return date_type.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date format. Use YYYY-MM-DD",
+        )
+
+
+# Columns read by the recovery endpoints. Selecting them directly returns
+# plain rows instead of hydrating RecoveryScore entities. The job stores
+# 0-100 component scores in the *_component columns.
+_RECOVERY_SCORE_COLUMNS = (
+    RecoveryScore.date,
+    RecoveryScore.overall_score,
+    RecoveryScore.status,
+    cast(RecoveryScore.hrv_component, Integer).label("hrv_score"),
+    cast(RecoveryScore.hr_component, Integer).label("hr_score"),
+    cast(RecoveryScore.sleep_component, Integer).label("sleep_score"),
+    cast(RecoveryScore.acwr_component, Integer).label("acwr_score"),
+    RecoveryScore.explanation,
+    RecoveryScore.cached_at,
+    RecoveryScore.cache_expires_at,
+)
+
+
+def _recovery_score_stmt(user_id: uuid.UUID, target_date: date_type) -> Select:
+    """Build the row query for one user's recovery score on a date."""
+    return select(*_RECOVERY_SCORE_COLUMNS).where(
+        RecoveryScore.user_id == user_id, RecoveryScore.date == target_date
+    )
+
+
+# Caches a recovery score response body only if the score's version counter
+# still holds the value read before the SELECT ('' when unset); a job that
+# rewrote the score in between has bumped it, so the stale body is dropped
+_CACHE_IF_CURRENT_LUA = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+_cache_if_current_script: Optional[AsyncScript] = None
+
+
+async def _cache_if_current(
+    redis: Redis, cache_key: str, version_key: str, version: str, body: str, ttl: int
+) -> bool:
+    """Cache a response body unless its score was rewritten since ``version``."""
+    global _cache_if_current_script
+    if _cache_if_current_script is None:
+        _cache_if_current_script = redis.register_script(_CACHE_IF_CURRENT_LUA)
+    return bool(
+        await _cache_if_current_script(
+            keys=[cache_key, version_key], args=[version, body, ttl], client=redis
+        )
+    )
+
 
 @router.get("/{date}", response_model=RecoveryScoreResponse)
 async def get_recovery_score(
     date: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Get recovery score for a specific date.
 
     Returns recovery score with component breakdown but without workout recommendation.
     Use GET /recovery/today for recommendation.
+
+    The response body is kept in Redis until the score's cache window ends;
+    the recovery job deletes it when it writes a new score.
     """
-    # Parse date
-    try:
-        target_date = date_type.fromisoformat(date)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date format. Use YYYY-MM-DD",
-        )
+    target_date = _parse_date_param(date)
+
+    # Read the cached body and the score version in one round-trip; the
+    # version guards the cache fill below against a concurrent recalculation
+    cache_key = recovery_score_cache_key(current_user.id, target_date)
+    version_key = recovery_score_version_key(current_user.id, target_date)
+    cached, version = await redis.mget(cache_key, version_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
 
     # Fetch recovery score
-    result = db.execute(
-        select(RecoveryScore).where(
-            RecoveryScore.user_id == current_user.id, RecoveryScore.date == target_date
-        )
-    )
-    recovery_score = result.scalar_one_or_none()
+    result = await db.execute(_recovery_score_stmt(current_user.id, target_date))
+    recovery_score = result.first()
 
     if not recovery_score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recovery score not found for {date}",
         )
+    _check_response_value(recovery_score.status, STATUS_COLORS, "status")
 
     # Check if cached score is expired (24 hours)
     is_expired = False
     if recovery_score.cached_at:
-        age = datetime.utcnow() - recovery_score.cached_at
+        age = datetime.now(timezone.utc) - recovery_score.cached_at
         is_expired = age > timedelta(hours=24)
 
-    # Build response
-    return RecoveryScoreResponse(
+    # Build response (fields come from the stored row, so skip validation)
+    response = RecoveryScoreResponse.model_construct(
         date=recovery_score.date,
         overall_score=recovery_score.overall_score,
         status=recovery_score.status,
-        components=ComponentScores(
-            hrv_score=recovery_score.hrv_score,
-            hr_score=recovery_score.hr_score,
-            sleep_score=recovery_score.sleep_score,
-            acwr_score=recovery_score.acwr_score,
-        ),
+        components=_component_scores(recovery_score),
         explanation=recovery_score.explanation or "",
-        cached_at=recovery_score.cached_at or datetime.utcnow(),
+        cached_at=recovery_score.cached_at or datetime.now(timezone.utc),
         is_expired=is_expired,
     )
 
+    # Returning a Response directly skips FastAPI's response_model
+    # re-validation, and pydantic-core writes the JSON without an intermediate
+    # dict; response_model still documents the schema
+    body = response.model_dump_json()
+
+    # Cache only while the score is fresh, so is_expired stays accurate
+    ttl = int(recovery_score.cache_expires_at.timestamp() - time.time())
+    if not is_expired and ttl > 0:
+        await _cache_if_current(
+            redis,
+            cache_key,
+            version_key,
+            version or "",
+            body,
+            min(ttl, RECOVERY_SCORE_VERSION_TTL_SECONDS),
+        )
+
+    return Response(body, media_type="application/json")
+
 
 @router.get("/today", response_model=RecoveryWithRecommendation)
 async def get_recovery_today(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
 ):
     """
     Get today's recovery score with workout recommendation.
@@ -104,60 +246,72 @@ async def get_recovery_today(
     """
     target_date = date_type.today()
 
-    # Fetch recovery score
-    result = db.execute(
-        select(RecoveryScore).where(
-            RecoveryScore.user_id == current_user.id, RecoveryScore.date == target_date
-        )
-    )
-    recovery_score = result.scalar_one_or_none()
+    result = await db.execute(_recovery_score_stmt(current_user.id, target_date))
+    recovery_score = result.first()
 
     if not recovery_score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Recovery score not found for today. Calculation may still be in progress.",
         )
+    _check_response_value(recovery_score.status, STATUS_COLORS, "status")
+
+    # Recent workouts and recovery history in one round-trip on the request
+    # session, so each request holds a single pool connection
+    recent_workouts, recovery_history = await _get_recovery_context(
+        db, current_user.id, target_date, days=7
+    )
 
     # Check if cached score is expired
     is_expired = False
     if recovery_score.cached_at:
-        age = datetime.utcnow() - recovery_score.cached_at
+        age = datetime.now(timezone.utc) - recovery_score.cached_at
         is_expired = age > timedelta(hours=24)
 
+    # Recovery inputs shared by the recommendation and alternatives services
+    component_scores = {
+        "hrv_score": recovery_score.hrv_score,
+        "hr_score": recovery_score.hr_score,
+        "sleep_score": recovery_score.sleep_score,
+        "acwr_score": recovery_score.acwr_score,
+    }
+    recovery_data = {
+        "overall_score": recovery_score.overall_score,
+        "status": recovery_score.status,
+        "anomaly_severity": "none",
+        "component_scores": component_scores,
+    }
+
     # Generate workout recommendation
-    recommendation = await _generate_workout_recommendation(
-        recovery_score, str(current_user.id), db
+    recommendation = _generate_workout_recommendation(
+        recovery_score, recovery_data, recent_workouts, recovery_history
     )
 
     # Generate alternatives
-    alternatives = await _generate_alternatives(
-        recovery_score, recommendation, str(current_user.id), db
-    )
+    alternatives = _generate_alternatives(recovery_data, recommendation)
 
-    # Build response
-    return RecoveryWithRecommendation(
+    # Build response (fields come from the stored row, so skip validation)
+    response = RecoveryWithRecommendation.model_construct(
         date=recovery_score.date,
         overall_score=recovery_score.overall_score,
         status=recovery_score.status,
-        components=ComponentScores(
-            hrv_score=recovery_score.hrv_score,
-            hr_score=recovery_score.hr_score,
-            sleep_score=recovery_score.sleep_score,
-            acwr_score=recovery_score.acwr_score,
-        ),
+        components=ComponentScores.model_construct(**component_scores),
         explanation=recovery_score.explanation or "",
-        cached_at=recovery_score.cached_at or datetime.utcnow(),
+        cached_at=recovery_score.cached_at or datetime.now(timezone.utc),
         is_expired=is_expired,
         recommendation=recommendation,
         alternatives=alternatives,
     )
 
+    return Response(response.model_dump_json(), media_type="application/json")
+
 
 @router.post("/{date}/recalculate", response_model=RecalculationResponse)
 async def recalculate_recovery_score(
     date: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Force recalculation of recovery score for a specific date.
@@ -165,34 +319,25 @@ async def recalculate_recovery_score(
     Rate limited to prevent abuse (5 minute cooldown per user).
     Triggers background Celery task for calculation.
     """
-    # Parse date
-    try:
-        target_date = date_type.fromisoformat(date)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date format. Use YYYY-MM-DD",
-        )
+    target_date = _parse_date_param(date)
 
     # Check rate limiting
-    cooldown_key = f"{current_user.id}:{date}"
-    if cooldown_key in _recalculation_cooldown:
-        last_request = _recalculation_cooldown[cooldown_key]
-        time_since = (datetime.utcnow() - last_request).total_seconds()
-        if time_since < RECALCULATION_COOLDOWN_SECONDS:
-            remaining = int(RECALCULATION_COOLDOWN_SECONDS - time_since)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Recalculation rate limit exceeded. Try again in {remaining} seconds.",
-            )
-
-    # Trigger recalculation
-    task = calculate_user_recovery_score.apply_async(
-        args=[str(current_user.id), date], countdown=0
-    )
+    cooldown_key = f"{RECALCULATION_COOLDOWN_PREFIX}:{current_user.id}:{date}"
+    remaining = await _claim_cooldown(redis, cooldown_key)
+    if remaining:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Recalculation rate limit exceeded. Try again in {remaining} seconds.",
+        )
 
-    # Update cooldown
-    _recalculation_cooldown[cooldown_key] = datetime.utcnow()
+    # Trigger recalculation, releasing the cooldown if the task can't be queued
+    try:
+        task = calculate_user_recovery_score.apply_async(
+            args=[str(current_user.id), date], kwargs={"force": True}, countdown=0
+        )
+    except Exception:
+        await redis.delete(cooldown_key)
+        raise
 
     return RecalculationResponse(
         task_id=task.id,
@@ -204,8 +349,36 @@ async def recalculate_recovery_score(
 # Helper functions
 
 
-async def _generate_workout_recommendation(
-    recovery_score: RecoveryScore, user_id: str, db: Session
+def _component_scores(recovery_score: Row) -> ComponentScores:
+    """Build the component breakdown from a recovery score row."""
+    return ComponentScores.model_construct(
+        hrv_score=recovery_score.hrv_score,
+        hr_score=recovery_score.hr_score,
+        sleep_score=recovery_score.sleep_score,
+        acwr_score=recovery_score.acwr_score,
+    )
+
+
+def _workout_details(details: Dict) -> WorkoutDetails:
+    """Map a recommender workout-details dict onto the response schema."""
+    get = details.get
+    return WorkoutDetails.model_construct(
+        duration=get("total_duration"),
+        zones=get("zones"),
+        structure=get("structure"),
+        warmup=get("warmup_duration"),
+        cooldown=get("cooldown_duration"),
+        work_duration=get("work_duration"),
+        rest_duration=get("rest_duration"),
+        num_intervals=get("num_intervals"),
+    )
+
+
+def _generate_workout_recommendation(
+    recovery_score: Row,
+    recovery_data: Dict,
+    recent_workouts: Sequence[Mapping],
+    recovery_history: List[Dict],
 ) -> WorkoutRecommendation:
     """Generate personalized workout recommendation based on recovery."""
     # Initialize services
@@ -214,25 +387,12 @@ async def _generate_workout_recommendation(
     rationale_service = RationaleService()
     overtraining_prevention = OvertrainingPrevention()
 
-    # Prepare recovery data
-    recovery_data = {
-        "overall_score": recovery_score.overall_score,
-        "status": recovery_score.status,
-        "anomaly_severity": recovery_score.anomaly_severity or "none",
-        "component_scores": {
-            "hrv_score": recovery_score.hrv_score,
-            "hr_score": recovery_score.hr_score,
-            "sleep_score": recovery_score.sleep_score,
-            "acwr_score": recovery_score.acwr_score,
-        },
-    }
+    # Anomaly detection results are not persisted on recovery scores yet
+    anomaly_warnings: List[str] = []
 
     # Map intensity
     recommended_intensity = intensity_mapper.map_intensity(recovery_data)
 
-    # Get recent workouts for context
-    recent_workouts = _get_recent_workouts(user_id, db, days=7)
-
     # Check overtraining risk
     (
         final_intensity,
@@ -240,7 +400,7 @@ async def _generate_workout_recommendation(
     ) = overtraining_prevention.check_overtraining_risk(
         recommended_intensity=recommended_intensity,
         recent_workouts=recent_workouts,
-        recovery_history=None,  # TODO: Add recovery history query
+        recovery_history=recovery_history,
     )
 
     # Select workout type
@@ -265,44 +425,32 @@ async def _generate_workout_recommendation(
         "recovery_score": recovery_score.overall_score,
         "recovery_status": recovery_score.status,
         "component_scores": recovery_data["component_scores"],
-        "warnings": recovery_score.anomaly_warnings or [],
+        "warnings": anomaly_warnings,
         "recent_workouts": recent_workouts,
     }
     rationale = rationale_service.generate_rationale(recommendation_data)
 
     # Collect warnings
-    warnings = []
     if overtraining_warning:
-        warnings.append(overtraining_warning)
-    if recovery_score.anomaly_warnings:
-        warnings.extend(recovery_score.anomaly_warnings)
+        warnings = [overtraining_warning, *anomaly_warnings]
+    else:
+        warnings = anomaly_warnings
+
+    _check_response_value(final_intensity, INTENSITY_LEVELS, "intensity")
 
-    return WorkoutRecommendation(
+    return WorkoutRecommendation.model_construct(
         intensity=final_intensity,
         workout_type=workout_type,
         duration=workout_details.get("total_duration", 60),
         rationale=rationale,
-        details=WorkoutDetails(
-            duration=workout_details.get("total_duration"),
-            zones=workout_details.get("zones"),
-            structure=workout_details.get("structure"),
-            warmup=workout_details.get("warmup_duration"),
-            cooldown=workout_details.get("cooldown_duration"),
-            work_duration=workout_details.get("work_duration"),
-            rest_duration=workout_details.get("rest_duration"),
-            num_intervals=workout_details.get("num_intervals"),
-        )
-        if workout_details
-        else None,
-        warnings=warnings if warnings else None,
+        details=_workout_details(workout_details) if workout_details else None,
+        warnings=warnings,
     )
 
 
-async def _generate_alternatives(
-    recovery_score: RecoveryScore,
+def _generate_alternatives(
+    recovery_data: Dict,
     primary_recommendation: WorkoutRecommendation,
-    user_id: str,
-    db: Session,
 ) -> List[AlternativeWorkout]:
     """Generate alternative workout options."""
     alternatives_service = AlternativesService()
@@ -315,17 +463,6 @@ async def _generate_alternatives(
         "sport": "cycling",  # TODO: Get from user profile
     }
 
-    recovery_data = {
-        "overall_score": recovery_score.overall_score,
-        "status": recovery_score.status,
-        "component_scores": {
-            "hrv_score": recovery_score.hrv_score,
-            "hr_score": recovery_score.hr_score,
-            "sleep_score": recovery_score.sleep_score,
-            "acwr_score": recovery_score.acwr_score,
-        },
-    }
-
     # Generate alternatives
     alternatives = alternatives_service.generate_alternatives(
         primary_recommendation=primary_rec_dict,
@@ -334,46 +471,66 @@ async def _generate_alternatives(
     )
 
     # Convert to schema
+    for alt in alternatives:
+        _check_response_value(alt["intensity"], INTENSITY_LEVELS, "intensity")
+
     return [
-        AlternativeWorkout(
+        AlternativeWorkout.model_construct(
             workout_type=alt["workout_type"],
             intensity=alt["intensity"],
             duration=alt.get("duration"),
             rationale=alt["rationale"],
-            details=WorkoutDetails(
-                duration=alt["details"].get("total_duration"),
-                zones=alt["details"].get("zones"),
-                structure=alt["details"].get("structure"),
-                warmup=alt["details"].get("warmup_duration"),
-                cooldown=alt["details"].get("cooldown_duration"),
-                work_duration=alt["details"].get("work_duration"),
-                rest_duration=alt["details"].get("rest_duration"),
-                num_intervals=alt["details"].get("num_intervals"),
-            )
-            if alt.get("details")
-            else None,
+            details=(_workout_details(alt["details"]) if alt.get("details") else None),
         )
         for alt in alternatives
     ]
 
 
-def _get_recent_workouts(user_id: str, db: Session, days: int = 7) -> List[Dict]:
-    """Fetch recent workout history for context."""
-    cutoff_date = date_type.today() - timedelta(days=days)
+async def _get_recovery_context(
+    db: AsyncSession, user_id: uuid.UUID, target_date: date_type, days: int = 7
+) -> Tuple[List[Dict], List[Dict]]:
+    """Fetch recent workouts and recovery history with a single UNION ALL.
 
-    result = db.execute(
-        select(Workout)
-        .where(Workout.user_id == user_id, Workout.workout_date >= cutoff_date)
-        .order_by(Workout.workout_date.desc())
+    Returns:
+        Tuple of (workouts newest first with date, workout_type and
+        training_stress_score; recovery scores leading up to target_date,
+        oldest first, with date and score)
+    """
+    cutoff_date = target_date - timedelta(days=days)
+
+    workouts = select(
+        literal("workout").label("kind"),
+        Workout.date,
+        Workout.workout_type,
+        Workout.training_load.label("value"),
+    ).where(Workout.user_id == user_id, Workout.date >= cutoff_date)
+    history = select(
+        literal("recovery").label("kind"),
+        RecoveryScore.date,
+        cast(null(), String).label("workout_type"),
+        RecoveryScore.overall_score.label("value"),
+    ).where(
+        RecoveryScore.user_id == user_id,
+        RecoveryScore.date > cutoff_date,
+        RecoveryScore.date <= target_date,
     )
-    workouts = result.scalars().all()
+    context = union_all(workouts, history).subquery()
+
+    result = await db.execute(select(context).order_by(context.c.date))
+
+    recent_workouts: List[Dict] = []
+    recovery_history: List[Dict] = []
+    for row in result:
+        if row.kind == "workout":
+            recent_workouts.append(
+                {
+                    "date": row.date,
+                    "workout_type": row.workout_type,
+                    "training_stress_score": row.value,
+                }
+            )
+        else:
+            recovery_history.append({"date": row.date, "score": row.value})
+    recent_workouts.reverse()
 
-    return [
-        {
-            "date": workout.workout_date,
-            "workout_type": workout.workout_type,
-            "intensity": workout.intensity,
-            "training_stress_score": workout.training_stress_score,
-        }
-        for workout in workouts
-    ]
+    return recent_workouts, recovery_history
@@ -6,13 +6,115 @@ Defines response models for:
 - Component score breakdown
 - Workout recommendations
 - Calculation status
+
+Trust boundary: these models describe data the API produces from database rows
+and the recommendation services, never client input. Route handlers build them
+with ``model_construct`` and skip validation; the allowed intensity and status
+values (``Intensity``/``StatusColor`` literals) are checked by the routes
+only when ``settings.debug`` is enabled.
 """
 
 from __future__ import annotations
 
 from datetime import date as date_type, datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Any, Dict, Literal, Optional, List, get_args
+from pydantic import BaseModel, Field, ConfigDict
+
+from src.config.settings import get_settings
+
+Intensity = Literal["hard", "moderate", "rest", "recovery"]
+StatusColor = Literal["green", "yellow", "red"]
+
+INTENSITY_LEVELS = get_args(Intensity)
+STATUS_COLORS = get_args(StatusColor)
+
+
+# OpenAPI examples, attached to the models only when debug is enabled so
+# production schemas (and /openapi.json) stay lean
+_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "ComponentScores": {
+        "hrv_score": 85,
+        "hr_score": 75,
+        "sleep_score": 90,
+        "acwr_score": 80,
+    },
+    "WorkoutDetails": {
+        "duration": 60,
+        "zones": [4, 5],
+        "structure": "8x 5min @ Z4-5 / 3min rest",
+        "warmup": 10,
+        "cooldown": 10,
+        "work_duration": 5,
+        "rest_duration": 3,
+        "num_intervals": 8,
+    },
+    "WorkoutRecommendation": {
+        "intensity": "hard",
+        "workout_type": "intervals",
+        "duration": 75,
+        "rationale": "Your recovery score of 85/100 indicates excellent recovery. You're ready for high-intensity training.",
+        "details": {
+            "duration": 60,
+            "zones": [4, 5],
+            "structure": "8x 5min @ Z4-5 / 3min rest",
+        },
+        "warnings": [],
+    },
+    "RecoveryScoreResponse": {
+        "date": "2025-10-24",
+        "overall_score": 85,
+        "status": "green",
+        "components": {
+            "hrv_score": 90,
+            "hr_score": 85,
+            "sleep_score": 80,
+            "acwr_score": 85,
+        },
+        "explanation": "✓ Excellent recovery (Score: 85/100)\nYou're well-recovered and ready for high-intensity training.",
+        "cached_at": "2025-10-24T06:30:00Z",
+        "is_expired": False,
+    },
+    "RecoveryWithRecommendation": {
+        "date": "2025-10-24",
+        "overall_score": 85,
+        "status": "green",
+        "components": {
+            "hrv_score": 90,
+            "hr_score": 85,
+            "sleep_score": 80,
+            "acwr_score": 85,
+        },
+        "explanation": "Excellent recovery",
+        "cached_at": "2025-10-24T06:30:00Z",
+        "is_expired": False,
+        "recommendation": {
+            "intensity": "hard",
+            "workout_type": "intervals",
+            "duration": 75,
+            "rationale": "You're well-recovered and ready for quality work",
+        },
+        "alternatives": [],
+    },
+    "CalculationStatusResponse": {
+        "task_id": "abc123-def456",
+        "status": "pending",
+        "message": "Recovery score calculation in progress",
+        "estimated_completion": 5,
+    },
+    "RecalculationResponse": {
+        "task_id": "task_12345",
+        "message": "Recovery score recalculation triggered for 2025-10-24",
+        "status": "triggered",
+    },
+    "ErrorResponse": {"detail": "Recovery score not found for the specified date"},
+}
+
+
+def _example_config(model_name: str) -> ConfigDict:
+    """Model config carrying the docs example for ``model_name`` in debug mode."""
+    if not get_settings().debug:
+        return ConfigDict()
+    return ConfigDict(json_schema_extra={"example": _EXAMPLES[model_name]})
 
 
 class ComponentScores(BaseModel):
@@ -31,16 +133,7 @@ class ComponentScores(BaseModel):
         None, ge=0, le=100, description="ACWR (training load) component score (0-100)"
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "hrv_score": 85,
-                "hr_score": 75,
-                "sleep_score": 90,
-                "acwr_score": 80,
-            }
-        }
-    )
+    model_config = _example_config("ComponentScores")
 
 
 class WorkoutDetails(BaseModel):
@@ -57,26 +150,13 @@ class WorkoutDetails(BaseModel):
     rest_duration: Optional[int] = Field(None, description="Rest interval duration")
     num_intervals: Optional[int] = Field(None, description="Number of intervals")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "duration": 60,
-                "zones": [4, 5],
-                "structure": "8x 5min @ Z4-5 / 3min rest",
-                "warmup": 10,
-                "cooldown": 10,
-                "work_duration": 5,
-                "rest_duration": 3,
-                "num_intervals": 8,
-            }
-        }
-    )
+    model_config = _example_config("WorkoutDetails")
 
 
 class WorkoutRecommendation(BaseModel):
     """Workout recommendation based on recovery."""
 
-    intensity: str = Field(..., description="Recommended intensity level")
+    intensity: Intensity = Field(..., description="Recommended intensity level")
     workout_type: str = Field(..., description="Recommended workout type")
     duration: Optional[int] = Field(None, description="Recommended duration in minutes")
     rationale: str = Field(..., description="Explanation for recommendation")
@@ -87,38 +167,14 @@ class WorkoutRecommendation(BaseModel):
         default_factory=list, description="Safety warnings or cautions"
     )
 
-    @field_validator("intensity")
-    @classmethod
-    def validate_intensity(cls, v):
-        """Validate intensity level."""
-        valid_intensities = ["hard", "moderate", "rest", "recovery"]
-        if v not in valid_intensities:
-            raise ValueError(f"Intensity must be one of {valid_intensities}")
-        return v
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "intensity": "hard",
-                "workout_type": "intervals",
-                "duration": 75,
-                "rationale": "Your recovery score of 85/100 indicates excellent recovery. You're ready for high-intensity training.",
-                "details": {
-                    "duration": 60,
-                    "zones": [4, 5],
-                    "structure": "8x 5min @ Z4-5 / 3min rest",
-                },
-                "warnings": [],
-            }
-        }
-    )
+    model_config = _example_config("WorkoutRecommendation")
 
 
 class AlternativeWorkout(BaseModel):
     """Alternative workout option."""
 
     workout_type: str = Field(..., description="Alternative workout type")
-    intensity: str = Field(..., description="Intensity level")
+    intensity: Intensity = Field(..., description="Intensity level")
     duration: Optional[int] = Field(None, description="Duration in minutes")
     rationale: str = Field(..., description="Why this alternative is suitable")
     details: Optional[WorkoutDetails] = None
@@ -131,39 +187,13 @@ class RecoveryScoreResponse(BaseModel):
     overall_score: int = Field(
         ..., ge=0, le=100, description="Overall recovery score (0-100)"
     )
-    status: str = Field(..., description="Recovery status color")
+    status: StatusColor = Field(..., description="Recovery status color")
     components: ComponentScores = Field(..., description="Component score breakdown")
     explanation: str = Field(..., description="Human-readable explanation")
     cached_at: datetime = Field(..., description="When score was calculated")
     is_expired: bool = Field(..., description="Whether cached score has expired")
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v):
-        """Validate status color."""
-        valid_statuses = ["green", "yellow", "red"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of {valid_statuses}")
-        return v
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "date": "2025-10-24",
-                "overall_score": 85,
-                "status": "green",
-                "components": {
-                    "hrv_score": 90,
-                    "hr_score": 85,
-                    "sleep_score": 80,
-                    "acwr_score": 85,
-                },
-                "explanation": "✓ Excellent recovery (Score: 85/100)\nYou're well-recovered and ready for high-intensity training.",
-                "cached_at": "2025-10-24T06:30:00Z",
-                "is_expired": False,
-            }
-        }
-    )
+    model_config = _example_config("RecoveryScoreResponse")
 
 
 class RecoveryWithRecommendation(RecoveryScoreResponse):
@@ -176,31 +206,7 @@ class RecoveryWithRecommendation(RecoveryScoreResponse):
         default_factory=list, description="Alternative workout options"
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "date": "2025-10-24",
-                "overall_score": 85,
-                "status": "green",
-                "components": {
-                    "hrv_score": 90,
-                    "hr_score": 85,
-                    "sleep_score": 80,
-                    "acwr_score": 85,
-                },
-                "explanation": "Excellent recovery",
-                "cached_at": "2025-10-24T06:30:00Z",
-                "is_expired": False,
-                "recommendation": {
-                    "intensity": "hard",
-                    "workout_type": "intervals",
-                    "duration": 75,
-                    "rationale": "You're well-recovered and ready for quality work",
-                },
-                "alternatives": [],
-            }
-        }
-    )
+    model_config = _example_config("RecoveryWithRecommendation")
 
 
 class CalculationStatusResponse(BaseModel):
@@ -213,16 +219,7 @@ class CalculationStatusResponse(BaseModel):
         None, description="Estimated completion time in seconds"
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "task_id": "abc123-def456",
-                "status": "pending",
-                "message": "Recovery score calculation in progress",
-                "estimated_completion": 5,
-            }
-        }
-    )
+    model_config = _example_config("CalculationStatusResponse")
 
 
 class RecalculationResponse(BaseModel):
@@ -232,15 +229,7 @@ class RecalculationResponse(BaseModel):
     message: str = Field(..., description="Confirmation message")
     status: str = Field(default="triggered", description="Task status")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "task_id": "task_12345",
-                "message": "Recovery score recalculation triggered for 2025-10-24",
-                "status": "triggered",
-            }
-        }
-    )
+    model_config = _example_config("RecalculationResponse")
 
 
 class ErrorResponse(BaseModel):
@@ -248,8 +237,4 @@ class ErrorResponse(BaseModel):
 
     detail: str = Field(..., description="Error message")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {"detail": "Recovery score not found for the specified date"}
-        }
-    )
+    model_config = _example_config("ErrorResponse")
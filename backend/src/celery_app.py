@@ -1,11 +1,45 @@
-"""Celery application with Redis broker."""
+"""
+Celery application with Redis broker.
+
+Garmin sync is almost entirely network I/O, so the ``garmin`` queue runs on its
+own thread-pool worker while CPU-bound recovery calculations stay on prefork::
+
+    celery -A src.celery_app worker -Q garmin -P threads -c 50 \\
+        --prefetch-multiplier 4
+    celery -A src.celery_app worker -Q celery,recovery,insights,plans
+
+Each sync runs its own asyncio event loop, and asyncio allows one running loop
+per OS thread, so the ``garmin`` queue must not use the gevent or eventlet
+pools. Every in-flight sync holds its own asyncpg connection, so ``-c`` also
+bounds the worker's database connections. Prefetch is a per-worker setting, so
+it is raised on the command line for the Garmin worker only.
+"""
 
 import os
+
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
 # Redis URL for broker and result backend
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+
+def _orjson_dumps(obj) -> str:
+    """Encode a task message or result with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# orjson-backed serializer for task messages and results; plain "json" is still
+# accepted so messages queued before the switch can be consumed
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Create Celery application
 celery_app = Celery(
     "ai_trainer",
@@ -15,9 +49,12 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
+    # Zstandard (registered by kombu when ``zstandard`` is installed) for
+    # stored results such as weekly insight payloads
+    result_compression="zstd",
     timezone="UTC",
     enable_utc=True,
     broker_connection_retry_on_startup=True,
@@ -39,6 +76,7 @@ celery_app.conf.update(
     },
 )
 
+
 # Auto-discover tasks in jobs directory
 celery_app.autodiscover_tasks(
     ["src.jobs"],
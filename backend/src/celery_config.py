@@ -59,8 +59,8 @@ task_settings = {
         "max_retries": 3,
         "countdown": 60,  # Wait 1 minute between retries
     },
-    # Task result compression
-    "task_compression": "gzip",
+    # Task message compression (kombu's Zstandard codec, needs ``zstandard``)
+    "task_compression": "zstd",
     # Task result extended
     "task_track_started": True,
     "task_send_sent_event": True,
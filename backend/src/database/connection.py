@@ -1,9 +1,19 @@
 """Database connection configuration using SQLAlchemy 2.0+ with asyncpg."""
 import os
 from contextlib import contextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, raiseload, registry, sessionmaker, Session
+from sqlalchemy.pool import NullPool
+
+from src.config.settings import get_settings
 
 # Get database URL from environment
 DATABASE_URL = os.getenv(
@@ -15,13 +25,24 @@ SYNC_DATABASE_URL = DATABASE_URL.replace(
     "postgresql+asyncpg://", "postgresql+psycopg2://"
 )
 
-# Create async engine
+_settings = get_settings()
+
+# Create async engine. asyncpg keeps a per-connection cache of prepared
+# statements so repeated ORM queries skip the server-side parse/plan step;
+# JIT is disabled because these short OLTP queries only pay its compile cost.
 engine = create_async_engine(
     DATABASE_URL,
     echo=os.getenv("DEBUG", "false").lower() == "true",
-    pool_size=5,
-    max_overflow=10,
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_max_overflow,
+    pool_timeout=_settings.db_pool_timeout,
+    pool_recycle=_settings.db_pool_recycle,
     pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": _settings.db_statement_cache_size,
+        "prepared_statement_cache_size": _settings.db_statement_cache_size,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create async session factory
@@ -33,21 +54,47 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Create declarative base for models
-Base = declarative_base()
+# Single process-wide mapper registry; every model maps through its Base and
+# shares one MetaData, which Alembic also targets
+mapper_registry = registry()
+Base = mapper_registry.generate_base()
 
-# Create synchronous engine (for Celery background jobs)
-sync_engine = create_engine(
-    SYNC_DATABASE_URL,
-    echo=os.getenv("DEBUG", "false").lower() == "true",
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
-)
 
-# Create synchronous session factory
+@lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Create the synchronous engine (for Celery background jobs) on first use.
+
+    The API process never opens sync sessions, so it neither builds this
+    engine nor loads psycopg2; each worker process builds it once.
+    """
+    return create_engine(
+        SYNC_DATABASE_URL,
+        echo=os.getenv("DEBUG", "false").lower() == "true",
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=_settings.db_pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_task_engine() -> AsyncEngine:
+    """Create the async engine used by Celery tasks that run ``asyncio.run``.
+
+    asyncpg connections are bound to the event loop that opened them and each
+    task runs its own loop, so connections are not pooled across tasks. Bind
+    sessions to it with ``AsyncSessionLocal(bind=get_task_engine())``.
+    """
+    return create_async_engine(
+        DATABASE_URL,
+        echo=os.getenv("DEBUG", "false").lower() == "true",
+        poolclass=NullPool,
+        connect_args={"server_settings": {"jit": "off"}},
+    )
+
+
+# Create synchronous session factory (bound to the sync engine per session)
 SyncSessionLocal = sessionmaker(
-    sync_engine,
     class_=Session,
     expire_on_commit=False,
     autocommit=False,
@@ -55,6 +102,28 @@ SyncSessionLocal = sessionmaker(
 )
 
 
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """Add ``raiseload("*")`` to top-level ORM SELECTs.
+
+    Any relationship a query did not eager-load (``selectinload()`` etc.)
+    then raises on access instead of issuing one SELECT per parent row.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*")
+        )
+
+
+# In tests, turn N+1 lazy loads into errors. Applies to every Session,
+# including the sync sessions behind AsyncSession.
+if _settings.environment == "test":
+    event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+
 async def get_db() -> AsyncSession:
     """
     Dependency to get database session.
@@ -88,7 +157,7 @@ def get_sync_db_session():
         with get_sync_db_session() as db:
             user = db.query(User).first()
     """
-    session = SyncSessionLocal()
+    session = SyncSessionLocal(bind=get_sync_engine())
     try:
         yield session
         session.commit()
@@ -97,3 +166,10 @@ def get_sync_db_session():
         raise
     finally:
         session.close()
+
+
+def __getattr__(name: str):
+    """Expose ``sync_engine`` lazily for direct imports (PEP 562)."""
+    if name == "sync_engine":
+        return get_sync_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
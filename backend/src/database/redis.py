@@ -1,9 +1,11 @@
 """Redis connection with async support."""
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 import redis.asyncio as redis
+from redis import Redis as SyncRedis
 from redis.asyncio import Redis
 
 
@@ -12,23 +14,29 @@ class RedisClient:
 
     def __init__(self) -> None:
         """Initialize Redis client."""
+        self._pool: Optional[redis.ConnectionPool] = None
         self._client: Optional[Redis] = None
         self._redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
     async def connect(self) -> None:
         """Connect to Redis."""
         if self._client is None:
-            self._client = await redis.from_url(
+            self._pool = redis.ConnectionPool.from_url(
                 self._redis_url,
                 encoding="utf-8",
                 decode_responses=True,
+                max_connections=50,
             )
+            self._client = Redis(connection_pool=self._pool)
 
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self._client:
             await self._client.close()
             self._client = None
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
 
     @property
     def client(self) -> Redis:
@@ -50,6 +58,26 @@ class RedisClient:
         """Set key-value pair with optional expiration (seconds)."""
         await self.client.set(key, value, ex=ex)
 
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Get several keys in one round-trip."""
+        return await self.client.mget(keys)
+
+    async def pipeline_exec(
+        self, ops: Iterable[Tuple[str, Sequence[Any]]]
+    ) -> List[Any]:
+        """Run several commands in one round-trip and return their results.
+
+        Args:
+            ops: (command name, args) pairs, e.g. [("get", ["a"]), ("ttl", ["a"])]
+
+        Returns:
+            One result per command, in order
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for command, args in ops:
+                getattr(pipe, command)(*args)
+            return await pipe.execute()
+
     async def delete(self, key: str) -> None:
         """Delete key."""
         await self.client.delete(key)
@@ -76,3 +104,12 @@ async def get_redis() -> Redis:
     if redis_client._client is None:
         await redis_client.connect()
     return redis_client.client
+
+
+@lru_cache(maxsize=1)
+def get_sync_redis() -> SyncRedis:
+    """Synchronous Redis client for Celery tasks, created once per process."""
+    return SyncRedis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+        decode_responses=True,
+    )
@@ -6,28 +6,124 @@ Runs daily at 6 AM or can be triggered manually.
 """
 
 from datetime import date, timedelta
+from typing import Any, Dict, List
+import asyncio
 import logging
+import uuid
 
+import httpx
+from celery import group
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import InvalidToken
 from src.celery_app import celery_app
-from src.database.connection import get_sync_db_session
+from src.database.connection import (
+    AsyncSessionLocal,
+    get_sync_db_session,
+    get_task_engine,
+)
+from src.models.health_metrics import HealthMetrics
 from src.models.user import User
+from src.models.workout import Workout
+from src.services.garmin.health_service import (
+    GarminAPIError,
+    GarminHealthService,
+    GarminRateLimitError,
+    GarminUnauthorizedError,
+)
+from src.services.garmin.workout_service import GarminWorkoutService
 from src.utils.encryption import decrypt_token
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Users fetched per server-side cursor batch (and queued per Celery group)
+SYNC_ALL_USERS_BATCH_SIZE = 1000
 
-@celery_app.task(bind=True, max_retries=5, default_retry_delay=60)
+# Days of workouts fetched per sync, ending on the sync date
+SYNC_WORKOUT_DAYS = 7
+
+# HTTP/2 client settings for the Garmin requests made by one sync. The client
+# lives for one task because it is bound to that task's event loop; the
+# wellness and fitness APIs share a host, so both requests multiplex over a
+# single connection. Connects fail fast so an unreachable host is retried by
+# Celery instead of holding a worker slot for the full read timeout.
+_GARMIN_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_GARMIN_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# HealthMetrics columns filled from the parsed Garmin dailies payload
+_HEALTH_METRIC_FIELDS = (
+    "hrv_ms",
+    "resting_hr",
+    "sleep_duration_minutes",
+    "sleep_score",
+    "stress_level",
+)
+
+
+class TransientGarminError(Exception):
+    """Sync failure worth retrying (rate limits, network or database hiccups)."""
+
+    pass
+
+
+class PermanentGarminError(Exception):
+    """Sync failure that will not succeed on retry (bad tokens, client errors)."""
+
+    pass
+
+
+def _classify_sync_error(exc: Exception) -> Exception:
+    """
+    Map an error raised during a sync to a retry category.
+
+    Args:
+        exc: Exception raised while decrypting tokens or talking to Garmin
+
+    Returns:
+        TransientGarminError or PermanentGarminError wrapping the message
+    """
+    if isinstance(exc, (InvalidTag, InvalidToken, GarminUnauthorizedError)):
+        return PermanentGarminError(str(exc))
+
+    if isinstance(exc, (GarminRateLimitError, httpx.TransportError, OperationalError)):
+        return TransientGarminError(str(exc))
+
+    if isinstance(exc, GarminAPIError):
+        cause = exc.__cause__
+        if isinstance(cause, httpx.HTTPStatusError) and cause.response.is_client_error:
+            return PermanentGarminError(str(exc))
+        return TransientGarminError(str(exc))
+
+    return PermanentGarminError(str(exc))
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(TransientGarminError,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=5,
+)
 def sync_user_garmin_data(self, user_id: str, sync_date: str = None):
     """
     Sync Garmin data for a single user.
 
+    Each call runs its own event loop with ``asyncio.run``. asyncio tracks the
+    running loop per OS thread, so the ``garmin`` queue must run on a prefork
+    or ``-P threads`` worker; under gevent/eventlet all tasks share one thread
+    and concurrent calls fail with "cannot be called from a running event loop".
+
     Args:
         user_id: UUID of user to sync
         sync_date: Optional ISO date string (defaults to yesterday)
 
     Raises:
-        Exception: If sync fails after retries
+        TransientGarminError: Retried with exponential backoff and jitter
+        PermanentGarminError: Fails the task immediately without retrying
     """
     try:
         # Parse sync date (default to yesterday to ensure data is available)
@@ -38,97 +134,144 @@ def sync_user_garmin_data(self, user_id: str, sync_date: str = None):
 
         logger.info(f"Starting Garmin sync for user {user_id}, date {target_date}")
 
-        # Get database session (sync context for Celery)
-        with get_sync_db_session() as db:
-            # Load user
-            user = db.execute(
-                select(User).where(User.id == user_id)
-            ).scalar_one_or_none()
-
-            if not user:
-                logger.error(f"User {user_id} not found")
-                return {"status": "error", "message": "User not found"}
-
-            # Verify user has Garmin connected
-            if not user.garmin_access_token:
-                logger.warning(f"User {user_id} has no Garmin account connected")
-                return {"status": "skipped", "message": "No Garmin account"}
-
-            # Decrypt tokens
-            access_token = decrypt_token(user.garmin_access_token)
-            refresh_token = decrypt_token(user.garmin_refresh_token)
-
-            # Create Garmin client
-            # Note: Need to convert to async context or use sync client
-            # For now, this is a simplified version
-            # TODO: Implement proper async/sync handling
-
-            # Sync health metrics
-            health_synced = _sync_health_metrics_sync(
-                db, user, access_token, refresh_token, target_date
-            )
-
-            # Sync workouts (last 7 days)
-            workouts_synced = _sync_workouts_sync(
-                db, user, access_token, refresh_token, target_date
-            )
-
-            logger.info(
-                f"Garmin sync complete for user {user_id}: "
-                f"{health_synced} health metrics, {workouts_synced} workouts"
-            )
-
-            return {
-                "status": "success",
-                "user_id": user_id,
-                "sync_date": str(target_date),
-                "health_metrics_synced": health_synced,
-                "workouts_synced": workouts_synced,
-            }
+        return asyncio.run(_sync_all(uuid.UUID(user_id), target_date))
 
-    except Exception as exc:
-        logger.error(f"Garmin sync failed for user {user_id}: {exc}")
+    except (TransientGarminError, PermanentGarminError):
+        raise
 
-        # Retry with exponential backoff
-        raise self.retry(exc=exc, countdown=2**self.request.retries)
+    except Exception as exc:
+        error = _classify_sync_error(exc)
+        logger.error(
+            f"Garmin sync failed for user {user_id} ({type(error).__name__}): {exc}"
+        )
+        raise error from exc
 
 
-def _sync_health_metrics_sync(
-    db, user: User, access_token: str, refresh_token: str, target_date: date
-) -> int:
+async def _sync_all(user_id: uuid.UUID, target_date: date) -> Dict[str, Any]:
     """
-    Sync health metrics for target date (synchronous version).
+    Fetch a user's health metrics and workouts concurrently and store them.
+
+    Runs inside ``asyncio.run`` in the Celery task, so the Garmin requests share
+    one HTTP/2 client and the database work goes through asyncpg.
+
+    Args:
+        user_id: UUID of user to sync
+        target_date: Date to sync health metrics for (workouts cover the
+            preceding week)
 
     Returns:
-        Number of metrics synced
+        Task result dict
     """
-    # TODO: Implement sync version or refactor to use async properly
-    # This is a placeholder that needs proper implementation
+    # Load only the user's Garmin token; the connection is released before
+    # the (much slower) Garmin requests start
+    async with AsyncSessionLocal(bind=get_task_engine()) as db:
+        row = (
+            await db.execute(select(User.garmin_access_token).where(User.id == user_id))
+        ).one_or_none()
+
+    if row is None:
+        logger.error(f"User {user_id} not found")
+        return {"status": "error", "message": "User not found"}
+
+    # Verify user has Garmin connected
+    if not row.garmin_access_token:
+        logger.warning(f"User {user_id} has no Garmin account connected")
+        return {"status": "skipped", "message": "No Garmin account"}
+
+    access_token = decrypt_token(row.garmin_access_token)
+
+    # Health metrics and the workout list are independent requests
+    async with httpx.AsyncClient(
+        http2=True, limits=_GARMIN_HTTP_LIMITS, timeout=_GARMIN_HTTP_TIMEOUT
+    ) as client:
+        health_service = GarminHealthService(access_token, http_client=client)
+        workout_service = GarminWorkoutService(access_token, http_client=client)
+        metrics, activities = await asyncio.gather(
+            health_service.get_daily_metrics(target_date),
+            workout_service.get_activities(
+                target_date - timedelta(days=SYNC_WORKOUT_DAYS - 1), target_date
+            ),
+        )
+
+    async with AsyncSessionLocal(bind=get_task_engine()) as db:
+        health_synced = await _save_health_metrics(db, user_id, metrics)
+        workouts_synced = await _save_workouts(db, user_id, activities)
+        await db.commit()
 
-    logger.info(f"Syncing health metrics for {user.id} on {target_date}")
+    logger.info(
+        f"Garmin sync complete for user {user_id}: "
+        f"{health_synced} health metrics, {workouts_synced} workouts"
+    )
 
-    # For now, return 0 indicating work needed
-    # In full implementation, would fetch from Garmin and save to DB
-    return 0
+    return {
+        "status": "success",
+        "user_id": str(user_id),
+        "sync_date": str(target_date),
+        "health_metrics_synced": health_synced,
+        "workouts_synced": workouts_synced,
+    }
 
 
-def _sync_workouts_sync(
-    db, user: User, access_token: str, refresh_token: str, target_date: date
+async def _save_health_metrics(
+    db: AsyncSession, user_id: uuid.UUID, metrics: Dict[str, Any]
 ) -> int:
     """
-    Sync workouts for last 7 days (synchronous version).
+    Upsert one day of health metrics.
 
     Returns:
-        Number of workouts synced
+        Number of metrics rows written (0 when Garmin had no data)
     """
-    # TODO: Implement sync version or refactor to use async properly
-    # This is a placeholder that needs proper implementation
+    values = {field: metrics.get(field) for field in _HEALTH_METRIC_FIELDS}
+    if all(value is None for value in values.values()):
+        return 0
+
+    stmt = pg_insert(HealthMetrics).values(
+        user_id=user_id, date=metrics["date"], **values
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[HealthMetrics.user_id, HealthMetrics.date],
+            set_=values,
+        )
+    )
+    return 1
 
-    logger.info(f"Syncing workouts for {user.id} around {target_date}")
 
-    # For now, return 0 indicating work needed
-    # In full implementation, would fetch from Garmin and save to DB
-    return 0
+async def _save_workouts(
+    db: AsyncSession, user_id: uuid.UUID, activities: List[Dict[str, Any]]
+) -> int:
+    """
+    Insert workouts that have not been synced before.
+
+    Returns:
+        Number of new workouts stored
+    """
+    if not activities:
+        return 0
+
+    rows = [
+        {
+            "user_id": user_id,
+            "date": activity["started_at"].date(),
+            "workout_type": activity["workout_type"],
+            "duration_minutes": activity["duration_minutes"],
+            "avg_heart_rate": activity.get("average_hr"),
+            "max_heart_rate": activity.get("max_hr"),
+            "training_load": activity.get("training_load"),
+            "perceived_exertion": activity.get("perceived_exertion"),
+            "source": "garmin",
+            "garmin_activity_id": activity["garmin_activity_id"],
+        }
+        for activity in activities
+    ]
+
+    result = await db.execute(
+        pg_insert(Workout)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Workout.garmin_activity_id])
+        .returning(Workout.id)
+    )
+    return len(result.all())
 
 
 @celery_app.task
@@ -140,33 +283,39 @@ def sync_all_users():
     """
     logger.info("Starting daily Garmin sync for all users")
 
+    yesterday = date.today() - timedelta(days=1)
+    total_users = 0
+    jobs_queued = 0
+
     with get_sync_db_session() as db:
-        # Find all users with Garmin connected
-        users = (
-            db.execute(select(User).where(User.garmin_access_token.isnot(None)))
-            .scalars()
-            .all()
+        # Stream IDs of users with Garmin connected through a server-side
+        # cursor, queuing one group of sync jobs per batch
+        result = db.execute(
+            select(User.id)
+            .where(User.garmin_access_token.isnot(None))
+            .execution_options(yield_per=SYNC_ALL_USERS_BATCH_SIZE)
         )
 
-        logger.info(f"Found {len(users)} users with Garmin connected")
-
-        # Queue individual sync jobs for each user
-        yesterday = date.today() - timedelta(days=1)
-        jobs_queued = 0
-
-        for user in users:
+        for user_ids in result.scalars().partitions():
+            total_users += len(user_ids)
             try:
-                sync_user_garmin_data.delay(
-                    user_id=str(user.id), sync_date=yesterday.isoformat()
-                )
-                jobs_queued += 1
+                group(
+                    sync_user_garmin_data.s(
+                        user_id=str(user_id), sync_date=yesterday.isoformat()
+                    )
+                    for user_id in user_ids
+                ).apply_async(queue="garmin")
+                jobs_queued += len(user_ids)
             except Exception as e:
-                logger.error(f"Failed to queue sync for user {user.id}: {e}")
-
-        logger.info(f"Queued {jobs_queued} Garmin sync jobs")
-
-        return {
-            "status": "success",
-            "total_users": len(users),
-            "jobs_queued": jobs_queued,
-        }
+                logger.error(f"Failed to queue Garmin sync batch: {e}")
+
+    logger.info(
+        f"Found {total_users} users with Garmin connected, "
+        f"queued {jobs_queued} Garmin sync jobs"
+    )
+
+    return {
+        "status": "success",
+        "total_users": total_users,
+        "jobs_queued": jobs_queued,
+    }
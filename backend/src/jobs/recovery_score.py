@@ -11,28 +11,135 @@ Runs daily via Celery Beat to update recovery scores.
 """
 
 from datetime import date, timedelta
-from typing import Optional, Dict, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Optional, Dict, List, Tuple
 import logging
+import uuid
 
-from sqlalchemy import select
+import orjson
+from celery import group
+from redis import RedisError
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 
 from src.celery_app import celery_app
 from src.database.connection import get_sync_db_session
+from src.database.redis import get_sync_redis
 from src.models.user import User
 from src.models.health_metrics import HealthMetrics
 from src.models.workout import Workout
 from src.models.recovery_score import RecoveryScore
-from src.services.recovery import (
-    HRVCalculator,
-    HRCalculator,
-    SleepCalculator,
-    ACWRCalculator,
-    RecoveryAggregator,
-    AnomalyDetector,
-)
 
 logger = logging.getLogger(__name__)
 
+# Days of health metrics history used for HRV/HR baselines
+HISTORY_DAYS = 7
+
+# Days of workout history used for ACWR (chronic load window)
+WORKOUT_HISTORY_DAYS = 28
+
+# Columns loaded per health metrics / workout row; health metrics rows are
+# passed to the calculators and anomaly detector without copying
+_METRIC_COLUMNS = (
+    HealthMetrics.date,
+    HealthMetrics.hrv_ms,
+    HealthMetrics.resting_hr,
+    HealthMetrics.sleep_duration_minutes,
+    HealthMetrics.sleep_score,
+)
+# Workout rows use the key ACWRCalculator reads, so they are passed to it as-is
+_WORKOUT_COLUMNS = (
+    Workout.date,
+    Workout.training_load.label("training_stress_score"),
+)
+
+# Users streamed per server-side cursor batch by the daily fan-out; each
+# batch's recovery inputs are loaded in one pair of queries
+RECOVERY_LOAD_BATCH_SIZE = 1000
+
+# Per-user tasks queued per Celery group by the daily fan-out
+RECOVERY_FANOUT_BATCH_SIZE = 100
+
+# Input rows keyed by user ID
+_RowsByUser = Dict[uuid.UUID, List[Dict[str, Any]]]
+
+# Columns overwritten when a score for the same user and date already exists
+_UPSERT_COLUMNS = (
+    "overall_score",
+    "hrv_component",
+    "hr_component",
+    "sleep_component",
+    "acwr_component",
+    "status",
+    "explanation",
+)
+
+# How long a stored score stays fresh; cached_at/cache_expires_at are set
+# from the database clock
+SCORE_CACHE_WINDOW = timedelta(hours=24)
+
+# Explanation heading and advice per score band, highest floor first
+_SCORE_BANDS = (
+    (
+        90,
+        "✓ Excellent recovery",
+        "You're well-recovered and ready for high-intensity training or racing.",
+    ),
+    (70, "✓ Good recovery", "You're recovered and ready for normal training loads."),
+    (50, "⚠ Moderate recovery", "Consider easier training or active recovery today."),
+    (
+        30,
+        "⚠ Poor recovery",
+        "Light activity or rest is recommended to avoid overtraining.",
+    ),
+    (
+        float("-inf"),
+        "✗ Critical - Low recovery",
+        "Complete rest is strongly recommended.",
+    ),
+)
+
+# Explanation label and weight per component score
+_COMPONENT_LABELS = (
+    ("hrv_score", "HRV", 40),
+    ("hr_score", "Resting HR", 30),
+    ("sleep_score", "Sleep", 20),
+    ("acwr_score", "Training Load", 10),
+)
+
+# Status per (score band, anomaly severity), where the band is score // 10.
+# Critical anomalies force red; warnings downgrade green (70+) to yellow;
+# otherwise 70+ is green, 40-69 yellow and below 40 red
+_STATUS_LUT = {
+    (band, severity): (
+        "red"
+        if severity == "critical" or band < 4
+        else "yellow"
+        if band < 7 or severity == "warning"
+        else "green"
+    )
+    for band in range(11)
+    for severity in (None, "none", "warning", "critical")
+}
+
+# Redis key prefix and TTL for memoized task results; matches the stored
+# score cache window
+RESULT_CACHE_PREFIX = "recovery:result"
+RESULT_CACHE_TTL_SECONDS = int(SCORE_CACHE_WINDOW.total_seconds())
+
+# Redis key prefixes for GET /recovery/{date} response bodies and their
+# version counters. The API fills a body only if the version it read before
+# its SELECT is unchanged; this job bumps the version and deletes the body
+# after it commits a new score, so a read racing the write cannot cache the
+# old score.
+RECOVERY_SCORE_CACHE_PREFIX = "recovery:score"
+RECOVERY_SCORE_VERSION_PREFIX = "recovery:score_version"
+# Versions outlive any body cached under them (bodies expire with the 24h
+# score window), so a counter never lapses and restarts mid-read
+RECOVERY_SCORE_VERSION_TTL_SECONDS = 2 * RESULT_CACHE_TTL_SECONDS
+
 
 @celery_app.task(
     name="calculate_user_recovery_score",
@@ -41,23 +148,38 @@ logger = logging.getLogger(__name__)
     default_retry_delay=60,
 )
 def calculate_user_recovery_score(
-    self, user_id: str, target_date: Optional[str] = None
+    self,
+    user_id: str,
+    target_date: Optional[str] = None,
+    payload: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    force: bool = False,
 ):
     """
     Calculate recovery score for a specific user.
 
     This task:
-    1. Fetches health metrics (HRV, HR, sleep) for target date
-    2. Fetches historical health data (7-28 days) for baselines
-    3. Fetches workout history for ACWR calculation
-    4. Calculates each component score
-    5. Aggregates final recovery score
-    6. Stores result in database
+    1. Fetches health metrics (HRV, HR, sleep) for target date together with
+       the 7 days before it (one query) for baselines
+    2. Fetches workout history for ACWR calculation
+    3. Calculates each component score
+    4. Aggregates final recovery score
+    5. Stores result in database
+
+    Steps 1-2 are skipped when the daily fan-out supplies ``payload``. Reads
+    and the final write each use their own short database session, so no
+    connection is held during steps 3-4. Unless
+    ``force`` is set, a result memoized in Redis or a stored score that has not
+    expired is returned without recomputing.
 
     Args:
         user_id: User UUID
         target_date: Date to calculate for (ISO format YYYY-MM-DD),
                     defaults to today
+        payload: Optional pre-fetched inputs with ``metrics`` (health metrics
+                 rows for the 7 days before and including target_date) and
+                 ``workouts`` (workout rows for the last 28 days), as built by
+                 calculate_all_users_recovery_scores
+        force: Recompute even if a cached result exists
 
     Returns:
         Dict with recovery score info or error message
@@ -69,162 +191,123 @@ def calculate_user_recovery_score(
         else:
             calc_date = date.today()
 
+        # Parse the user ID once; queries below bind the UUID directly
+        uid = user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(user_id)
+
         logger.info(f"Calculating recovery score for user {user_id} on {calc_date}")
 
-        with get_sync_db_session() as db:
-            # Verify user exists
-            user = db.execute(
-                select(User).where(User.id == user_id)
-            ).scalar_one_or_none()
-
-            if not user:
-                logger.error(f"User {user_id} not found")
-                return {"error": "User not found"}
-
-            # Fetch today's health metrics
-            today_metrics = db.execute(
-                select(HealthMetrics).where(
-                    HealthMetrics.user_id == user_id, HealthMetrics.date == calc_date
-                )
-            ).scalar_one_or_none()
-
-            if not today_metrics:
-                logger.warning(f"No health metrics for user {user_id} on {calc_date}")
-                return {"error": "No health metrics available for target date"}
-
-            # Fetch historical health metrics (last 7 days for rolling averages)
-            start_date = calc_date - timedelta(days=7)
-            historical_metrics = (
-                db.execute(
-                    select(HealthMetrics)
-                    .where(
-                        HealthMetrics.user_id == user_id,
-                        HealthMetrics.date >= start_date,
-                        HealthMetrics.date < calc_date,
-                    )
-                    .order_by(HealthMetrics.date)
-                )
-                .scalars()
-                .all()
-            )
+        cache_key = _result_cache_key(user_id, calc_date)
+        if not force:
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                return cached
 
-            # Fetch workout history (last 28 days for ACWR)
-            workout_start_date = calc_date - timedelta(days=28)
-            workout_history = (
-                db.execute(
-                    select(Workout)
-                    .where(
-                        Workout.user_id == user_id,
-                        Workout.date >= workout_start_date,
-                        Workout.date <= calc_date,
-                    )
-                    .order_by(Workout.date)
-                )
-                .scalars()
-                .all()
-            )
+        # Short session for the reads, released before the calculation
+        with get_sync_db_session() as db:
+            if not force:
+                stored = _load_unexpired_result(db, uid, calc_date)
+                if stored is not None:
+                    _cache_result(cache_key, stored)
+                    return stored
+
+            if payload is None:
+                payload = _load_inputs(db, uid, calc_date)
+                if payload is None:
+                    logger.error(f"User {user_id} not found")
+                    return {"error": "User not found"}
+
+        metrics = [_parse_row_date(row) for row in payload["metrics"]]
+
+        # Split today's metrics (the last row, if present) from the history
+        today_metrics = next(
+            (m for m in reversed(metrics) if m["date"] == calc_date), None
+        )
+        historical_metrics = [m for m in metrics if m["date"] < calc_date]
 
-            # Calculate component scores
-            component_scores = _calculate_components(
-                today_metrics=today_metrics,
-                historical_metrics=historical_metrics,
-                workout_history=workout_history,
-            )
+        if not today_metrics:
+            logger.warning(f"No health metrics for user {user_id} on {calc_date}")
+            return {"error": "No health metrics available for target date"}
 
-            # Aggregate final score
-            aggregator = RecoveryAggregator()
-            final_score = aggregator.calculate_final_score(component_scores)
+        # ACWR only reads the load, so payload workout dates stay ISO strings
+        workout_history = payload["workouts"]
 
-            if final_score is None:
-                logger.warning(
-                    f"Could not calculate recovery score for user {user_id} - insufficient data"
-                )
-                return {"error": "Insufficient data for recovery score calculation"}
-
-            # Detect anomalies and generate warnings
-            detector = AnomalyDetector()
-            today_metrics_dict = {
-                "hrv_ms": today_metrics.hrv_ms,
-                "resting_hr": today_metrics.resting_hr,
-                "total_sleep_seconds": today_metrics.total_sleep_seconds,
-            }
-            historical_metrics_dict = [
-                {"hrv_ms": m.hrv_ms, "resting_hr": m.resting_hr, "date": m.date}
-                for m in historical_metrics
-            ]
-            anomaly_result = detector.detect_anomalies(
-                today_metrics=today_metrics_dict,
-                historical_metrics=historical_metrics_dict,
-                component_scores=component_scores,
-            )
+        # Calculate component scores
+        component_scores = _calculate_components(
+            today_metrics=today_metrics,
+            historical_metrics=historical_metrics,
+            workout_history=workout_history,
+        )
 
-            # Generate explanation text
-            explanation = _generate_explanation(
-                final_score=final_score,
-                component_scores=component_scores,
-                anomaly_result=anomaly_result,
-            )
+        # Imported here so the API and beat processes, which only queue
+        # this task, do not load the recovery services
+        from src.services.recovery import AnomalyDetector, RecoveryAggregator
 
-            # Determine status (green/yellow/red)
-            status = _determine_status(final_score, anomaly_result)
+        # Aggregate final score
+        aggregator = RecoveryAggregator()
+        final_score = aggregator.calculate_final_score(component_scores)
 
-            # Calculate cache expiration (24 hours from now)
-            from datetime import datetime, timedelta
+        if final_score is None:
+            logger.warning(
+                f"Could not calculate recovery score for user {user_id} - insufficient data"
+            )
+            return {"error": "Insufficient data for recovery score calculation"}
+
+        # Detect anomalies and generate warnings
+        detector = AnomalyDetector()
+        anomaly_result = detector.detect_anomalies(
+            today_metrics=today_metrics,
+            historical_metrics=historical_metrics,
+            component_scores=component_scores,
+        )
 
-            cached_at = datetime.utcnow()
-            cache_expires_at = cached_at + timedelta(hours=24)
+        # Generate explanation text
+        explanation = _generate_explanation(
+            final_score=final_score,
+            component_scores=component_scores,
+            anomaly_result=anomaly_result,
+        )
 
-            # Check for existing record
-            existing = db.execute(
-                select(RecoveryScore).where(
-                    RecoveryScore.user_id == user_id, RecoveryScore.date == calc_date
-                )
-            ).scalar_one_or_none()
-
-            if existing:
-                # Update existing record
-                existing.overall_score = final_score
-                existing.hrv_component = component_scores.get("hrv_score")
-                existing.hr_component = component_scores.get("hr_score")
-                existing.sleep_component = component_scores.get("sleep_score")
-                existing.acwr_component = component_scores.get("acwr_score")
-                existing.status = status
-                existing.explanation = explanation
-                existing.cached_at = cached_at
-                existing.cache_expires_at = cache_expires_at
-            else:
-                # Create new record
-                recovery_score = RecoveryScore(
-                    user_id=user_id,
-                    date=calc_date,
-                    overall_score=final_score,
-                    hrv_component=component_scores.get("hrv_score"),
-                    hr_component=component_scores.get("hr_score"),
-                    sleep_component=component_scores.get("sleep_score"),
-                    acwr_component=component_scores.get("acwr_score"),
-                    status=status,
-                    explanation=explanation,
-                    cached_at=cached_at,
-                    cache_expires_at=cache_expires_at,
-                )
-                db.add(recovery_score)
+        # Determine status (green/yellow/red)
+        status = _determine_status(final_score, anomaly_result)
 
+        # Second short session for the write
+        with get_sync_db_session() as db:
+            persist_recovery_scores_bulk(
+                db,
+                [
+                    {
+                        "user_id": uid,
+                        "date": calc_date,
+                        "overall_score": final_score,
+                        "hrv_component": component_scores.get("hrv_score"),
+                        "hr_component": component_scores.get("hr_score"),
+                        "sleep_component": component_scores.get("sleep_score"),
+                        "acwr_component": component_scores.get("acwr_score"),
+                        "status": status,
+                        "explanation": explanation,
+                    }
+                ],
+            )
             db.commit()
 
-            logger.info(
-                f"Recovery score calculated for user {user_id}: {final_score} "
-                f"(HRV={component_scores.get('hrv_score')}, "
-                f"HR={component_scores.get('hr_score')}, "
-                f"Sleep={component_scores.get('sleep_score')}, "
-                f"ACWR={component_scores.get('acwr_score')})"
-            )
+        _invalidate_cached_response(uid, calc_date)
 
-            return {
-                "user_id": user_id,
-                "date": str(calc_date),
-                "score": final_score,
-                "components": component_scores,
-            }
+        logger.info(
+            f"Recovery score calculated for user {user_id}: {final_score} "
+            f"(HRV={component_scores.get('hrv_score')}, "
+            f"HR={component_scores.get('hr_score')}, "
+            f"Sleep={component_scores.get('sleep_score')}, "
+            f"ACWR={component_scores.get('acwr_score')})"
+        )
+
+        result = {
+            "user_id": user_id,
+            "date": str(calc_date),
+            "score": final_score,
+            "components": component_scores,
+        }
+        _cache_result(cache_key, result)
+        return result
 
     except Exception as e:
         logger.error(f"Error calculating recovery score for user {user_id}: {str(e)}")
@@ -237,93 +320,403 @@ def calculate_all_users_recovery_scores():
     Calculate recovery scores for all active users.
 
     This task is scheduled to run daily (via Celery Beat at 6:30 AM).
-    It triggers individual calculation tasks for each user.
+    It streams the users with health metrics for today through a server-side
+    cursor and, per batch, loads their recovery inputs in two queries and
+    triggers an individual calculation task per user with those inputs
+    attached, so the per-user tasks do not read them again.
 
     Returns:
         Dict with summary of tasks triggered
     """
     try:
+        calc_date = date.today()
+        task_ids = []
+
         with get_sync_db_session() as db:
-            # Get all active users with Garmin connected
-            users = (
-                db.execute(
-                    select(User).where(
-                        User.is_active == True, User.garmin_access_token.isnot(None)
-                    )
+            # Users without metrics for today would only return an error
+            users = db.execute(
+                select(HealthMetrics.user_id)
+                .join(User, User.id == HealthMetrics.user_id)
+                .where(
+                    User.is_active.is_(True),
+                    User.garmin_access_token.isnot(None),
+                    HealthMetrics.date == calc_date,
                 )
-                .scalars()
-                .all()
+                .execution_options(yield_per=RECOVERY_LOAD_BATCH_SIZE)
             )
 
-            logger.info(f"Starting recovery score calculation for {len(users)} users")
-
-            # Trigger individual tasks for each user
-            task_ids = []
-            for user in users:
-                task = calculate_user_recovery_score.delay(str(user.id))
-                task_ids.append(task.id)
+            for user_ids in users.scalars().partitions():
+                metrics_by_user, workouts_by_user = _load_recovery_inputs(
+                    db, user_ids, calc_date
+                )
 
-            return {
-                "total_users": len(users),
-                "tasks_triggered": len(task_ids),
-                "task_ids": task_ids,
-            }
+                # Queue one group of per-user tasks per fan-out batch
+                for start in range(0, len(user_ids), RECOVERY_FANOUT_BATCH_SIZE):
+                    batch = user_ids[start : start + RECOVERY_FANOUT_BATCH_SIZE]
+                    group_result = group(
+                        calculate_user_recovery_score.s(
+                            str(user_id),
+                            calc_date.isoformat(),
+                            payload={
+                                "metrics": metrics_by_user[user_id],
+                                "workouts": workouts_by_user.get(user_id, []),
+                            },
+                        )
+                        for user_id in batch
+                    ).apply_async()
+                    task_ids.extend(result.id for result in group_result.results)
+
+        logger.info(f"Triggered recovery score calculation for {len(task_ids)} users")
+
+        return {
+            "total_users": len(task_ids),
+            "tasks_triggered": len(task_ids),
+            "task_ids": task_ids,
+        }
 
     except Exception as e:
         logger.error(f"Error triggering recovery score calculations: {str(e)}")
         return {"error": str(e)}
 
 
+def persist_recovery_scores_bulk(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert or update recovery scores in one INSERT ... ON CONFLICT statement.
+
+    cached_at and cache_expires_at come from the database clock: column
+    server defaults on insert, now() on update.
+
+    Args:
+        db: Database session (the caller commits)
+        rows: RecoveryScore column values, one dict per user and date
+    """
+    if not rows:
+        return
+
+    stmt = pg_insert(RecoveryScore).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[RecoveryScore.user_id, RecoveryScore.date],
+            set_={
+                **{column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+                "cached_at": func.now(),
+                "cache_expires_at": func.now() + SCORE_CACHE_WINDOW,
+            },
+        )
+    )
+
+
+def recovery_score_cache_key(user_id: uuid.UUID, target_date: date) -> str:
+    """Build the Redis key for a cached recovery score response."""
+    return f"{RECOVERY_SCORE_CACHE_PREFIX}:{user_id}:{target_date.isoformat()}"
+
+
+def recovery_score_version_key(user_id: uuid.UUID, target_date: date) -> str:
+    """Build the Redis key for a cached recovery score response's version."""
+    return f"{RECOVERY_SCORE_VERSION_PREFIX}:{user_id}:{target_date.isoformat()}"
+
+
+def _invalidate_cached_response(user_id: uuid.UUID, target_date: date) -> None:
+    """Drop the cached API response for a rewritten score; errors are logged."""
+    version_key = recovery_score_version_key(user_id, target_date)
+    try:
+        pipe = get_sync_redis().pipeline()
+        pipe.incr(version_key)
+        pipe.expire(version_key, RECOVERY_SCORE_VERSION_TTL_SECONDS)
+        pipe.delete(recovery_score_cache_key(user_id, target_date))
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Recovery score response invalidation failed: {str(e)}")
+
+
+def _result_cache_key(user_id: str, calc_date: date) -> str:
+    """Build the Redis key for a memoized task result."""
+    return f"{RESULT_CACHE_PREFIX}:{user_id}:{calc_date.isoformat()}"
+
+
+def _get_cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return a memoized task result, or None on a miss or Redis error."""
+    try:
+        cached = get_sync_redis().get(cache_key)
+    except RedisError as e:
+        logger.warning(f"Recovery result cache read failed: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+def _cache_result(cache_key: str, result: Dict[str, Any]) -> None:
+    """Memoize a task result; Redis errors are logged, not raised."""
+    try:
+        get_sync_redis().setex(
+            cache_key, RESULT_CACHE_TTL_SECONDS, orjson.dumps(result)
+        )
+    except RedisError as e:
+        logger.warning(f"Recovery result cache write failed: {str(e)}")
+
+
+def _load_unexpired_result(
+    db: Session, user_id: uuid.UUID, calc_date: date
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a stored recovery score whose cache window has not expired.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        calc_date: Date to calculate for
+
+    Returns:
+        Task result dict, or None if no unexpired score is stored
+    """
+    row = db.execute(
+        select(
+            RecoveryScore.overall_score,
+            RecoveryScore.hrv_component,
+            RecoveryScore.hr_component,
+            RecoveryScore.sleep_component,
+            RecoveryScore.acwr_component,
+        ).where(
+            RecoveryScore.user_id == user_id,
+            RecoveryScore.date == calc_date,
+            RecoveryScore.cache_expires_at > func.now(),
+        )
+    ).first()
+
+    if row is None:
+        return None
+
+    components = {
+        "hrv_score": row.hrv_component,
+        "hr_score": row.hr_component,
+        "sleep_score": row.sleep_component,
+        "acwr_score": row.acwr_component,
+    }
+    return {
+        "user_id": str(user_id),
+        "date": str(calc_date),
+        "score": row.overall_score,
+        "components": {
+            name: int(value) if value is not None else None
+            for name, value in components.items()
+        },
+    }
+
+
+def _user_exists(db: Session, user_id: uuid.UUID) -> bool:
+    """Check whether a user row exists without loading it."""
+    return (
+        db.execute(select(literal(1)).where(User.id == user_id).limit(1)).first()
+        is not None
+    )
+
+
+def _load_inputs(
+    db: Session, user_id: uuid.UUID, calc_date: date
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Load one user's recovery inputs in the shape of the fan-out payload.
+
+    Workouts are only loaded when there are health metrics for calc_date;
+    without them, the user's existence is checked instead.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        calc_date: Date to calculate for
+
+    Returns:
+        Dict with ``metrics`` and ``workouts`` rows, or None if the user does
+        not exist
+    """
+    metrics = _load_health_metrics(db, user_id, calc_date)
+
+    # Rows are ordered by date, so today's metrics are last if present
+    if not metrics or metrics[-1]["date"] != calc_date:
+        if not _user_exists(db, user_id):
+            return None
+        return {"metrics": metrics, "workouts": []}
+
+    return {"metrics": metrics, "workouts": _load_workouts(db, user_id, calc_date)}
+
+
+def _load_health_metrics(
+    db: Session, user_id: uuid.UUID, calc_date: date
+) -> List[Dict[str, Any]]:
+    """
+    Load one user's health metrics for the 7 days before and including
+    calc_date, ordered by date, in a single query.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        calc_date: Date to calculate for
+
+    Returns:
+        Health metrics rows
+    """
+    rows = (
+        db.execute(
+            select(*_METRIC_COLUMNS)
+            .where(
+                HealthMetrics.user_id == user_id,
+                HealthMetrics.date >= calc_date - timedelta(days=HISTORY_DAYS),
+                HealthMetrics.date <= calc_date,
+            )
+            .order_by(HealthMetrics.date)
+        )
+        .mappings()
+        .all()
+    )
+    return [dict(row) for row in rows]
+
+
+def _load_workouts(
+    db: Session, user_id: uuid.UUID, calc_date: date
+) -> List[Dict[str, Any]]:
+    """
+    Load one user's workouts for the last 28 days, ordered by date.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        calc_date: Date to calculate for
+
+    Returns:
+        Workout rows
+    """
+    rows = (
+        db.execute(
+            select(*_WORKOUT_COLUMNS)
+            .where(
+                Workout.user_id == user_id,
+                Workout.date >= calc_date - timedelta(days=WORKOUT_HISTORY_DAYS),
+                Workout.date <= calc_date,
+            )
+            .order_by(Workout.date)
+        )
+        .mappings()
+        .all()
+    )
+    return [dict(row) for row in rows]
+
+
+def _load_recovery_inputs(
+    db: Session, user_ids: List[uuid.UUID], calc_date: date
+) -> Tuple[_RowsByUser, _RowsByUser]:
+    """
+    Load recovery inputs for a batch of users.
+
+    Args:
+        db: Database session
+        user_ids: Users to load inputs for
+        calc_date: Date to calculate for
+
+    Returns:
+        Tuple of (health metrics rows, workout rows), each keyed by user ID and
+        ordered by date; see _load_health_metrics and _load_workouts for the
+        windows
+    """
+    metrics = (
+        db.execute(
+            select(HealthMetrics.user_id, *_METRIC_COLUMNS)
+            .where(
+                HealthMetrics.user_id.in_(user_ids),
+                HealthMetrics.date >= calc_date - timedelta(days=HISTORY_DAYS),
+                HealthMetrics.date <= calc_date,
+            )
+            .order_by(HealthMetrics.user_id, HealthMetrics.date)
+        )
+        .mappings()
+        .all()
+    )
+
+    workouts = (
+        db.execute(
+            select(Workout.user_id, *_WORKOUT_COLUMNS)
+            .where(
+                Workout.user_id.in_(user_ids),
+                Workout.date >= calc_date - timedelta(days=WORKOUT_HISTORY_DAYS),
+                Workout.date <= calc_date,
+            )
+            .order_by(Workout.user_id, Workout.date)
+        )
+        .mappings()
+        .all()
+    )
+
+    return _group_by_user(metrics), _group_by_user(workouts)
+
+
+def _group_by_user(rows) -> _RowsByUser:
+    """Group user-ordered rows into per-user lists, dropping the user_id key."""
+    return {
+        user_id: [
+            {key: value for key, value in row.items() if key != "user_id"}
+            for row in user_rows
+        ]
+        for user_id, user_rows in groupby(rows, key=itemgetter("user_id"))
+    }
+
+
+def _parse_row_date(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore the ``date`` of a payload row serialized as an ISO string."""
+    if isinstance(row["date"], str):
+        row = {**row, "date": date.fromisoformat(row["date"])}
+    return row
+
+
 def _calculate_components(
-    today_metrics: HealthMetrics,
-    historical_metrics: List[HealthMetrics],
-    workout_history: List[Workout],
+    today_metrics: Dict[str, Any],
+    historical_metrics: List[Dict[str, Any]],
+    workout_history: List[Dict[str, Any]],
 ) -> Dict[str, Optional[int]]:
     """
     Calculate all component scores.
 
     Args:
-        today_metrics: Today's health metrics
-        historical_metrics: Historical health metrics (7+ days)
-        workout_history: Workout history (28+ days)
+        today_metrics: Today's health metrics row
+        historical_metrics: Historical health metrics rows (7+ days)
+        workout_history: Workout rows (28+ days)
 
     Returns:
         Dict with component scores (may contain None for missing components)
     """
+    from src.services.recovery import (
+        ACWRCalculator,
+        HRCalculator,
+        HRVCalculator,
+        SleepCalculator,
+    )
+
     components = {}
 
     # HRV Component (40% weight)
     hrv_calc = HRVCalculator()
-    historical_hrv = [{"date": m.date, "hrv_ms": m.hrv_ms} for m in historical_metrics]
     components["hrv_score"] = hrv_calc.calculate_component(
-        current_hrv=today_metrics.hrv_ms, historical_data=historical_hrv
+        current_hrv=today_metrics["hrv_ms"], historical_data=historical_metrics
     )
 
     # HR Component (30% weight)
     hr_calc = HRCalculator()
-    historical_hr = [
-        {"date": m.date, "resting_hr": m.resting_hr} for m in historical_metrics
-    ]
     components["hr_score"] = hr_calc.calculate_component(
-        current_hr=today_metrics.resting_hr, historical_data=historical_hr
+        current_hr=today_metrics["resting_hr"], historical_data=historical_metrics
     )
 
     # Sleep Component (20% weight)
     sleep_calc = SleepCalculator()
+    sleep_minutes = today_metrics["sleep_duration_minutes"]
     sleep_data = {
-        "date": today_metrics.date,
-        "total_sleep_seconds": today_metrics.total_sleep_seconds,
-        "sleep_quality_score": today_metrics.sleep_quality_score,
+        "date": today_metrics["date"],
+        "total_sleep_seconds": (
+            sleep_minutes * 60 if sleep_minutes is not None else None
+        ),
+        "sleep_quality_score": today_metrics["sleep_score"],
     }
     components["sleep_score"] = sleep_calc.calculate_component(sleep_data)
 
     # ACWR Component (10% weight)
     acwr_calc = ACWRCalculator()
-    workout_data = [
-        {"date": w.date, "training_stress_score": w.training_stress_score}
-        for w in workout_history
-    ]
-    components["acwr_score"] = acwr_calc.calculate_component(workout_data)
+    components["acwr_score"] = acwr_calc.calculate_component(workout_history)
 
     return components
 
@@ -344,51 +737,32 @@ def _generate_explanation(
     Returns:
         Explanation text for the recovery score
     """
-    lines = []
+    # Overall score interpretation: first band whose floor the score reaches
+    heading, advice = next(
+        (heading, advice)
+        for floor, heading, advice in _SCORE_BANDS
+        if final_score >= floor
+    )
+    lines = [f"{heading} (Score: {final_score}/100)", advice, "\nComponent Scores:"]
 
-    # Overall score interpretation
-    if final_score >= 90:
-        lines.append(f"✓ Excellent recovery (Score: {final_score}/100)")
-        lines.append(
-            "You're well-recovered and ready for high-intensity training or racing."
-        )
-    elif final_score >= 70:
-        lines.append(f"✓ Good recovery (Score: {final_score}/100)")
-        lines.append("You're recovered and ready for normal training loads.")
-    elif final_score >= 50:
-        lines.append(f"⚠ Moderate recovery (Score: {final_score}/100)")
-        lines.append("Consider easier training or active recovery today.")
-    elif final_score >= 30:
-        lines.append(f"⚠ Poor recovery (Score: {final_score}/100)")
-        lines.append("Light activity or rest is recommended to avoid overtraining.")
-    else:
-        lines.append(f"✗ Critical - Low recovery (Score: {final_score}/100)")
-        lines.append("Complete rest is strongly recommended.")
-
-    # Component breakdown
-    lines.append("\nComponent Scores:")
-    if component_scores.get("hrv_score") is not None:
-        lines.append(f"  • HRV: {component_scores['hrv_score']}/100 (40% weight)")
-    if component_scores.get("hr_score") is not None:
-        lines.append(f"  • Resting HR: {component_scores['hr_score']}/100 (30% weight)")
-    if component_scores.get("sleep_score") is not None:
-        lines.append(f"  • Sleep: {component_scores['sleep_score']}/100 (20% weight)")
-    if component_scores.get("acwr_score") is not None:
-        lines.append(
-            f"  • Training Load: {component_scores['acwr_score']}/100 (10% weight)"
-        )
+    # Component breakdown, skipping missing components
+    lines.extend(
+        f"  • {label}: {component_scores[key]}/100 ({weight}% weight)"
+        for key, label, weight in _COMPONENT_LABELS
+        if component_scores.get(key) is not None
+    )
 
     # Anomaly warnings
     if anomaly_result.get("has_anomalies"):
         lines.append("\n⚠ HEALTH ALERTS:")
-        for warning in anomaly_result.get("warnings", []):
-            lines.append(f"  • {warning}")
+        warnings = anomaly_result.get("warnings", [])
+        lines.extend(f"  • {warning}" for warning in warnings)
 
     # Recommendations
-    if anomaly_result.get("recommendations"):
+    recommendations = anomaly_result.get("recommendations")
+    if recommendations:
         lines.append("\nRecommendations:")
-        for rec in anomaly_result.get("recommendations", []):
-            lines.append(f"  • {rec}")
+        lines.extend(f"  • {rec}" for rec in recommendations)
 
     return "\n".join(lines)
 
@@ -404,17 +778,4 @@ def _determine_status(final_score: int, anomaly_result: Dict[str, any]) -> str:
     Returns:
         Status: 'green', 'yellow', or 'red'
     """
-    # Critical anomalies override score-based status
-    if anomaly_result.get("severity") == "critical":
-        return "red"
-
-    # Score-based status
-    if final_score >= 70:
-        # But downgrade to yellow if there are warnings
-        if anomaly_result.get("severity") == "warning":
-            return "yellow"
-        return "green"
-    elif final_score >= 40:
-        return "yellow"
-    else:
-        return "red"
+    return _STATUS_LUT[(final_score // 10, anomaly_result.get("severity"))]
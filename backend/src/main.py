@@ -8,10 +8,12 @@ load_dotenv()
 
 # Standard library and third-party imports
 from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 
 # Local application imports
 from src.api.routes import auth, garmin, recovery  # noqa: E402
+from src.config.settings import get_settings  # noqa: E402
 from src.database.connection import engine  # noqa: E402
 
 
@@ -20,10 +22,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup: Tables are created via Alembic migrations
     # No need to create them here
+    app.state.settings = get_settings()
 
     yield
 
     # Shutdown: Close connections
+    await garmin.close_oauth_http_client()
     await engine.dispose()
 
 
@@ -34,6 +38,7 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
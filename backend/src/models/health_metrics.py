@@ -86,8 +86,19 @@ class HealthMetrics(Base):
 
     # Table constraints
     __table_args__ = (
-        # Compound index for fast time-series queries
-        Index("ix_health_metrics_user_date", "user_id", "date"),
+        # Covering index for time-series queries; INCLUDEs the recovery inputs
+        # so the recovery job's history window is an index-only scan
+        Index(
+            "ix_health_metrics_user_date_cov",
+            "user_id",
+            "date",
+            postgresql_include=[
+                "hrv_ms",
+                "resting_hr",
+                "sleep_duration_minutes",
+                "sleep_score",
+            ],
+        ),
         # Unique constraint to prevent duplicate dates per user
         Index("uq_health_metrics_user_date", "user_id", "date", unique=True),
         # Check constraints for valid ranges
@@ -13,7 +13,13 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     TIMESTAMP,
+    and_,
+    case,
+    false,
+    func,
+    text,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.connection import Base
@@ -138,8 +144,13 @@ class PlannedWorkout(Base):
     __table_args__ = (
         # Compound index for fast queries by plan and date
         Index("ix_planned_workouts_plan_date", "training_plan_id", "scheduled_date"),
-        # Index for finding incomplete workouts
-        Index("ix_planned_workouts_completion", "is_completed"),
+        # Partial index over pending (neither completed nor skipped) workouts
+        Index(
+            "ix_planned_workouts_pending",
+            "training_plan_id",
+            "scheduled_date",
+            postgresql_where=text("is_completed = false AND skipped = false"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -153,24 +164,50 @@ class PlannedWorkout(Base):
         )
         return f"<PlannedWorkout(plan_id={self.training_plan_id}, date={self.scheduled_date}, type={self.workout_type}, status={status})>"
 
-    @property
+    @hybrid_property
     def is_overdue(self) -> bool:
         """Check if workout is past its scheduled date and not completed."""
         if not self.is_completed and not self.skipped:
             return date.today() > self.scheduled_date
         return False
 
-    @property
+    @is_overdue.inplace.expression
+    @classmethod
+    def _is_overdue_expression(cls):
+        """SQL form of is_overdue, usable with ix_planned_workouts_pending."""
+        return and_(
+            cls.is_completed == false(),
+            cls.skipped == false(),
+            cls.scheduled_date < func.current_date(),
+        )
+
+    @hybrid_property
     def status(self) -> str:
         """Get human-readable status."""
         if self.is_completed:
             return "completed"
         elif self.skipped:
             return "skipped"
-        elif self.is_overdue:
+
+        # Read the clock once for the date comparisons below
+        today = date.today()
+        if self.scheduled_date < today:
             return "overdue"
-        elif self.scheduled_date == date.today():
+        elif self.scheduled_date == today:
             return "today"
-        elif self.scheduled_date > date.today():
+        elif self.scheduled_date > today:
             return "upcoming"
         return "pending"
+
+    @status.inplace.expression
+    @classmethod
+    def _status_expression(cls):
+        """SQL form of status, e.g. ``where(PlannedWorkout.status == "overdue")``."""
+        return case(
+            (cls.is_completed, "completed"),
+            (cls.skipped, "skipped"),
+            (cls.scheduled_date < func.current_date(), "overdue"),
+            (cls.scheduled_date == func.current_date(), "today"),
+            (cls.scheduled_date > func.current_date(), "upcoming"),
+            else_="pending",
+        )
@@ -14,6 +14,8 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     TIMESTAMP,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -103,12 +105,13 @@ class RecoveryScore(Base):
     cached_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         doc="When this score was calculated/cached",
     )
     cache_expires_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
+        server_default=text("now() + interval '24 hours'"),
         doc="When this cached score expires (24 hours from calculation)",
     )
 
@@ -125,7 +125,10 @@ class TrainingPlan(Base):
         "PlannedWorkout",
         back_populates="training_plan",
         cascade="all, delete-orphan",
-        order_by="PlannedWorkout.scheduled_date",
+        # Leading with the foreign key matches ix_planned_workouts_plan_date,
+        # so selectinload()'s IN (...) query is an ordered index scan with
+        # no sort; per-plan order is still by scheduled_date
+        order_by="[PlannedWorkout.training_plan_id, PlannedWorkout.scheduled_date]",
     )
 
     # Table constraints
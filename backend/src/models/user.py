@@ -4,8 +4,9 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Text, Boolean, TIMESTAMP
+from sqlalchemy import String, Text, Boolean, Index, TIMESTAMP, and_, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.connection import Base
@@ -51,7 +52,7 @@ class User(Base):
         doc="User's email address (used for authentication)",
     )
     hashed_password: Mapped[str] = mapped_column(
-        Text, nullable=False, doc="Bcrypt hashed password"
+        Text, nullable=False, doc="Argon2id (or legacy bcrypt) hashed password"
     )
     full_name: Mapped[Optional[str]] = mapped_column(
         String(255), nullable=True, doc="User's full name"
@@ -104,55 +105,57 @@ class User(Base):
         doc="When current access token expires",
     )
 
-    # Relationships (will be populated as models are created)
+    # Relationships. Collections load lazily; queries that need them eager-load
+    # with selectinload(). Child rows are removed by the ON DELETE CASCADE
+    # foreign keys, so deleting a user does not load its collections.
     health_metrics: Mapped[list["HealthMetrics"]] = relationship(
         "HealthMetrics",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     workouts: Mapped[list["Workout"]] = relationship(
         "Workout",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     recovery_scores: Mapped[list["RecoveryScore"]] = relationship(
         "RecoveryScore",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     workout_recommendations: Mapped[list["WorkoutRecommendation"]] = relationship(
         "WorkoutRecommendation",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     insights: Mapped[list["Insight"]] = relationship(
         "Insight",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     goals: Mapped[list["Goal"]] = relationship(
         "Goal",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     training_plans: Mapped[list["TrainingPlan"]] = relationship(
         "TrainingPlan",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         """String representation of User."""
         return f"<User(id={self.id}, email={self.email})>"
 
-    @property
+    @hybrid_property
     def is_garmin_connected(self) -> bool:
         """Check if user has an active Garmin connection."""
         return (
@@ -161,3 +164,24 @@ class User(Base):
             and self.garmin_token_expires_at is not None
             and self.garmin_token_expires_at > datetime.utcnow()
         )
+
+    @is_garmin_connected.inplace.expression
+    @classmethod
+    def _is_garmin_connected_expression(cls):
+        """SQL form of is_garmin_connected, e.g. ``where(User.is_garmin_connected)``."""
+        return and_(
+            cls.garmin_user_id.isnot(None),
+            cls.garmin_access_token.isnot(None),
+            cls.garmin_token_expires_at > func.now(),
+        )
+
+
+# Case-insensitive unique index backing email lookups in register/login
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
+
+# Partial index so the daily sync's "Garmin connected" ID scan is index-only
+Index(
+    "ix_users_garmin_connected",
+    User.id,
+    postgresql_where=User.garmin_access_token.isnot(None),
+)
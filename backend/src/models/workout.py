@@ -115,8 +115,14 @@ class Workout(Base):
 
     # Table constraints
     __table_args__ = (
-        # Compound index for fast time-series queries
-        Index("ix_workouts_user_date", "user_id", "date"),
+        # Covering index for time-series queries; INCLUDEs training_load so
+        # the recovery job's ACWR window is an index-only scan
+        Index(
+            "ix_workouts_user_date_load",
+            "user_id",
+            "date",
+            postgresql_include=["training_load"],
+        ),
         # Index for Garmin activity lookups
         Index("ix_workouts_garmin_activity", "garmin_activity_id", unique=True),
     )
@@ -300,12 +300,14 @@ class GarminCache:
                 f"{self.WORKOUT_DETAIL_PREFIX}:{user_id}:*",
             ]
 
-            total_deleted = 0
-            for pattern in patterns:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    deleted = await self.redis.delete(*keys)
-                    total_deleted += deleted
+            # One round-trip for the lookups and one for the delete
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for pattern in patterns:
+                    pipe.keys(pattern)
+                key_groups = await pipe.execute()
+
+            keys = [key for group in key_groups for key in group]
+            total_deleted = await self.redis.delete(*keys) if keys else 0
 
             logger.info(f"Invalidated {total_deleted} cache keys for user {user_id}")
             return total_deleted
@@ -325,13 +327,15 @@ class GarminCache:
             Dict with cache statistics
         """
         try:
-            health_keys = await self.redis.keys(f"{self.HEALTH_PREFIX}:{user_id}:*")
-            workout_list_keys = await self.redis.keys(
-                f"{self.WORKOUT_LIST_PREFIX}:{user_id}:*"
-            )
-            workout_detail_keys = await self.redis.keys(
-                f"{self.WORKOUT_DETAIL_PREFIX}:{user_id}:*"
-            )
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.keys(f"{self.HEALTH_PREFIX}:{user_id}:*")
+                pipe.keys(f"{self.WORKOUT_LIST_PREFIX}:{user_id}:*")
+                pipe.keys(f"{self.WORKOUT_DETAIL_PREFIX}:{user_id}:*")
+                (
+                    health_keys,
+                    workout_list_keys,
+                    workout_detail_keys,
+                ) = await pipe.execute()
 
             return {
                 "health_metrics_cached": len(health_keys),
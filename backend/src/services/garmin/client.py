@@ -12,7 +12,7 @@ from typing import Optional
 from src.services.garmin.oauth_service import GarminOAuthService
 from src.services.garmin.health_service import GarminHealthService
 from src.services.garmin.workout_service import GarminWorkoutService
-from src.config.settings import settings
+from src.config.settings import get_settings
 
 
 class GarminClient:
@@ -46,10 +46,11 @@ class GarminClient:
         self.token_expires_at = token_expires_at
 
         # OAuth service for token management
+        settings = get_settings()
         self.oauth_service = GarminOAuthService(
-            client_id=client_id or settings.GARMIN_CLIENT_ID,
-            client_secret=client_secret or settings.GARMIN_CLIENT_SECRET,
-            redirect_uri=settings.GARMIN_CALLBACK_URL,
+            client_id=client_id or settings.garmin_client_id,
+            client_secret=client_secret or settings.garmin_client_secret,
+            redirect_uri=settings.garmin_callback_url,
         )
 
         # Service instances (created lazily)
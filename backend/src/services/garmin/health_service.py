@@ -55,16 +55,24 @@ class GarminHealthService:
     RETRY_WAIT_MAX = 10  # seconds
     REQUEST_TIMEOUT = 30  # seconds
 
-    def __init__(self, access_token: str, user_id: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: str,
+        user_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize health service with access token.
 
         Args:
             access_token: Valid OAuth access token
             user_id: Optional user ID for caching
+            http_client: Optional shared client for API requests. When
+                omitted, each request opens (and closes) its own client.
         """
         self.access_token = access_token
         self.user_id = user_id
+        self._http_client = http_client
         self.parser = HealthMetricsParser()
         self.cache = GarminCache()
 
@@ -139,45 +147,44 @@ class GarminHealthService:
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
         try:
-            async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-                response = await client.get(url, params=params, headers=headers)
-
-                # Handle specific error codes
-                if response.status_code == 401:
-                    logger.error(
-                        f"Unauthorized access to Garmin API for date {target_date}"
-                    )
-                    raise GarminUnauthorizedError("Access token expired or invalid")
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After", 60)
-                    logger.warning(
-                        f"Rate limit exceeded. Retry after {retry_after} seconds"
-                    )
-                    raise GarminRateLimitError(
-                        f"Rate limit exceeded. Retry after {retry_after}s"
-                    )
-
-                if response.status_code == 404:
-                    # No data for this date (not an error)
-                    logger.info(f"No health data available for {target_date}")
-                    return self._empty_metrics(target_date)
-
-                # Raise for other HTTP errors
-                response.raise_for_status()
-
-                # Parse response
-                data = response.json()
-
-                # API returns array, get first item
-                if data and len(data) > 0:
-                    logger.debug(
-                        f"Successfully fetched health metrics for {target_date}"
-                    )
-                    return self.parser.parse(data[0])
-                else:
-                    logger.info(f"No health metrics returned for {target_date}")
-                    return self._empty_metrics(target_date)
+            response = await self._get(url, params=params, headers=headers)
+
+            # Handle specific error codes
+            if response.status_code == 401:
+                logger.error(
+                    f"Unauthorized access to Garmin API for date {target_date}"
+                )
+                raise GarminUnauthorizedError(
+                    "Unauthorized - access token expired or invalid"
+                )
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", 60)
+                logger.warning(
+                    f"Rate limit exceeded. Retry after {retry_after} seconds"
+                )
+                raise GarminRateLimitError(
+                    f"Rate limit exceeded. Retry after {retry_after}s"
+                )
+
+            if response.status_code == 404:
+                # No data for this date (not an error)
+                logger.info(f"No health data available for {target_date}")
+                return self._empty_metrics(target_date)
+
+            # Raise for other HTTP errors
+            response.raise_for_status()
+
+            # Parse response
+            data = response.json()
+
+            # API returns array, get first item
+            if data and len(data) > 0:
+                logger.debug(f"Successfully fetched health metrics for {target_date}")
+                return self.parser.parse(data[0])
+            else:
+                logger.info(f"No health metrics returned for {target_date}")
+                return self._empty_metrics(target_date)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout fetching health metrics for {target_date}: {e}")
@@ -193,12 +200,28 @@ class GarminHealthService:
             logger.error(f"HTTP error fetching health metrics for {target_date}: {e}")
             raise GarminAPIError(f"HTTP {e.response.status_code}: {e}") from e
 
+        except GarminAPIError:
+            raise
+
         except Exception as e:
             logger.exception(
                 f"Unexpected error fetching health metrics for {target_date}: {e}"
             )
             raise GarminAPIError(f"Unexpected error: {e}") from e
 
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        GET a Garmin API URL, reusing the shared HTTP client when one was supplied.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._http_client is not None:
+            return await self._http_client.get(url, **kwargs)
+
+        async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
+            return await client.get(url, **kwargs)
+
     def _empty_metrics(self, target_date: date) -> Dict[str, Any]:
         """Return empty metrics structure for a date."""
         return {
@@ -242,14 +265,13 @@ class GarminHealthService:
 
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        response = await self._get(url, params=params, headers=headers)
 
-            if response.status_code == 401:
-                raise Exception("Unauthorized - access token expired or invalid")
+        if response.status_code == 401:
+            raise Exception("Unauthorized - access token expired or invalid")
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            # Parse all responses
-            data = response.json()
-            return [self.parser.parse(item) for item in data]
+        # Parse all responses
+        data = response.json()
+        return [self.parser.parse(item) for item in data]
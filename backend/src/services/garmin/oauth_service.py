@@ -40,7 +40,13 @@ class GarminOAuthService:
     CODE_VERIFIER_LENGTH = 64  # 43-128 characters allowed, using 64
     STATE_LENGTH = 32  # Minimum 32 characters for security
 
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize OAuth service with client credentials.
 
@@ -48,6 +54,8 @@ class GarminOAuthService:
             client_id: Garmin application consumer key
             client_secret: Garmin application consumer secret
             redirect_uri: Callback URL for OAuth redirect
+            http_client: Optional shared client for token requests. When
+                omitted, each request opens (and closes) its own client.
 
         Raises:
             ValueError: If credentials are invalid
@@ -58,6 +66,7 @@ class GarminOAuthService:
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.challenge_method = "S256"  # SHA-256 hashing
+        self._http_client = http_client
 
     def _validate_credentials(
         self, client_id: str, client_secret: str, redirect_uri: str
@@ -237,16 +246,7 @@ class GarminOAuthService:
         }
 
         # Make token request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_ENDPOINT,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            response.raise_for_status()
-
-            return response.json()
+        return await self._post_token_request(data)
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -275,16 +275,33 @@ class GarminOAuthService:
         }
 
         # Make refresh request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_ENDPOINT,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+        return await self._post_token_request(data)
+
+    async def _post_token_request(self, data: Dict[str, str]) -> Dict[str, Any]:
+        """
+        POST form data to the token endpoint and return the JSON body.
+
+        Reuses the shared HTTP client when one was supplied so the TLS
+        connection to Garmin stays pooled between token requests.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        if self._http_client is not None:
+            response = await self._http_client.post(
+                self.TOKEN_ENDPOINT, data=data, headers=headers
             )
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    self.TOKEN_ENDPOINT, data=data, headers=headers
+                )
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            return response.json()
+        return response.json()
 
     def _calculate_expiration(self, expires_in_seconds: int) -> datetime:
         """
@@ -15,6 +15,10 @@ from typing import Dict, Any, List, Optional
 import httpx
 import logging
 
+from src.services.garmin.health_service import (
+    GarminRateLimitError,
+    GarminUnauthorizedError,
+)
 from src.services.garmin.parsers import WorkoutParser, HeartRateZoneParser
 from src.services.garmin.cache import GarminCache
 
@@ -26,16 +30,24 @@ class GarminWorkoutService:
 
     BASE_URL = "https://apis.garmin.com/fitness-api/rest"
 
-    def __init__(self, access_token: str, user_id: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: str,
+        user_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize workout service with access token.
 
         Args:
             access_token: Valid OAuth access token
             user_id: Optional user ID for caching
+            http_client: Optional shared client for API requests. When
+                omitted, each request opens (and closes) its own client.
         """
         self.access_token = access_token
         self.user_id = user_id
+        self._http_client = http_client
         self.workout_parser = WorkoutParser()
         self.hr_zone_parser = HeartRateZoneParser()
         self.cache = GarminCache()
@@ -112,22 +124,23 @@ class GarminWorkoutService:
 
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        response = await self._get(url, params=params, headers=headers)
 
-            # Handle rate limiting
-            if response.status_code == 429:
-                raise Exception("Rate limit exceeded - too many requests")
+        # Handle rate limiting
+        if response.status_code == 429:
+            raise GarminRateLimitError("Rate limit exceeded - too many requests")
 
-            # Handle unauthorized
-            if response.status_code == 401:
-                raise Exception("Unauthorized - access token expired or invalid")
+        # Handle unauthorized
+        if response.status_code == 401:
+            raise GarminUnauthorizedError(
+                "Unauthorized - access token expired or invalid"
+            )
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            # Parse activities
-            data = response.json()
-            return [self.workout_parser.parse(activity) for activity in data]
+        # Parse activities
+        data = response.json()
+        return [self.workout_parser.parse(activity) for activity in data]
 
     async def get_activity_details(self, activity_id: str) -> Dict[str, Any]:
         """
@@ -179,25 +192,37 @@ class GarminWorkoutService:
 
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+        response = await self._get(url, headers=headers)
 
-            if response.status_code == 401:
-                raise Exception("Unauthorized - access token expired or invalid")
+        if response.status_code == 401:
+            raise Exception("Unauthorized - access token expired or invalid")
 
-            if response.status_code == 404:
-                raise Exception(f"Activity {activity_id} not found")
+        if response.status_code == 404:
+            raise Exception(f"Activity {activity_id} not found")
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            # Parse activity
-            data = response.json()
-            workout = self.workout_parser.parse(data)
+        # Parse activity
+        data = response.json()
+        workout = self.workout_parser.parse(data)
 
-            # Parse HR zones if available
-            if "heartRateZones" in data:
-                workout["heart_rate_zones"] = self.hr_zone_parser.parse(
-                    data["heartRateZones"]
-                )
+        # Parse HR zones if available
+        if "heartRateZones" in data:
+            workout["heart_rate_zones"] = self.hr_zone_parser.parse(
+                data["heartRateZones"]
+            )
+
+        return workout
 
-            return workout
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        GET a Garmin API URL, reusing the shared HTTP client when one was supplied.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._http_client is not None:
+            return await self._http_client.get(url, **kwargs)
+
+        async with httpx.AsyncClient() as client:
+            return await client.get(url, **kwargs)
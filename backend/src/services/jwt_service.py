@@ -1,10 +1,11 @@
 """JWT token service for authentication."""
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+import jwt
+from jwt import get_algorithm_by_name
 
 from src.config.settings import get_settings
 
@@ -13,8 +14,18 @@ class JWTService:
     """Service for creating and verifying JWT tokens."""
 
     def __init__(self):
-        """Initialize JWT service with settings."""
+        """Initialize JWT service with settings.
+
+        The signing key is prepared once here so encode/decode reuse the same
+        key object instead of re-deriving it from the configured secret (or
+        re-parsing a PEM for asymmetric algorithms) on every call.
+        """
         self.settings = get_settings()
+        self._algorithm = self.settings.jwt_algorithm
+        self._algorithms = [self._algorithm]
+        self._key = get_algorithm_by_name(self._algorithm).prepare_key(
+            self.settings.jwt_secret_key
+        )
 
     def create_access_token(
         self, user_id: uuid.UUID, expires_delta: Optional[timedelta] = None
@@ -33,7 +44,7 @@ class JWTService:
                 minutes=self.settings.jwt_access_token_expire_minutes
             )
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         expire = now + expires_delta
 
         to_encode = {
@@ -43,11 +54,7 @@ class JWTService:
             "exp": expire,
         }
 
-        encoded_jwt = jwt.encode(
-            to_encode,
-            self.settings.jwt_secret_key,
-            algorithm=self.settings.jwt_algorithm,
-        )
+        encoded_jwt = jwt.encode(to_encode, self._key, algorithm=self._algorithm)
         return encoded_jwt
 
     def create_refresh_token(
@@ -65,7 +72,7 @@ class JWTService:
         if expires_delta is None:
             expires_delta = timedelta(days=self.settings.jwt_refresh_token_expire_days)
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         expire = now + expires_delta
 
         to_encode = {
@@ -75,11 +82,7 @@ class JWTService:
             "exp": expire,
         }
 
-        encoded_jwt = jwt.encode(
-            to_encode,
-            self.settings.jwt_secret_key,
-            algorithm=self.settings.jwt_algorithm,
-        )
+        encoded_jwt = jwt.encode(to_encode, self._key, algorithm=self._algorithm)
         return encoded_jwt
 
     def verify_token(self, token: str, expected_type: str) -> dict:
@@ -93,15 +96,11 @@ class JWTService:
             Decoded token payload
 
         Raises:
-            JWTError: If token is invalid or expired
+            jwt.InvalidTokenError: If token is invalid or expired
             ValueError: If token type doesn't match expected type
         """
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_secret_key,
-                algorithms=[self.settings.jwt_algorithm],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
 
             token_type = payload.get("type")
             if token_type != expected_type:
@@ -111,7 +110,7 @@ class JWTService:
 
             return payload
 
-        except JWTError as e:
+        except jwt.InvalidTokenError as e:
             raise e
 
     def get_user_id_from_token(self, token: str) -> Optional[uuid.UUID]:
@@ -124,14 +123,10 @@ class JWTService:
             User ID if valid, None otherwise
         """
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_secret_key,
-                algorithms=[self.settings.jwt_algorithm],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
             user_id_str = payload.get("sub")
             if user_id_str:
                 return uuid.UUID(user_id_str)
             return None
-        except (JWTError, ValueError):
+        except (jwt.InvalidTokenError, ValueError):
             return None
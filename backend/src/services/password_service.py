@@ -1,9 +1,21 @@
 """Password hashing and verification service."""
 
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
-# Bcrypt context for password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id context for password hashing (argon2-cffi backend). Parameters
+# follow the OWASP baseline: 46 MiB memory, 2 iterations, 1 lane. Existing
+# bcrypt hashes still verify and are upgraded to Argon2id on the next login
+# (see PasswordService.verify_and_update).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=46 * 1024,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 
 class PasswordService:
@@ -33,3 +45,19 @@ class PasswordService:
             True if password matches, False otherwise
         """
         return pwd_context.verify(plain_password, hashed_password)
+
+    @staticmethod
+    def verify_and_update(
+        plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if its hash is deprecated.
+
+        Args:
+            plain_password: Plain text password to verify
+            hashed_password: Hashed password to compare against
+
+        Returns:
+            Tuple of (password matches, replacement Argon2id hash or None if
+            the stored hash is current or the password did not match)
+        """
+        return pwd_context.verify_and_update(plain_password, hashed_password)
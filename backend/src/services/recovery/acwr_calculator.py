@@ -23,9 +23,11 @@ This helps prevent:
 - Optimizes progressive overload for fitness adaptation
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 import logging
 
+from src.services.recovery.scoring import interpolate_score
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,7 @@ class ACWRCalculator:
         (1.5, 30),  # 1.5 = 30 (high injury risk)
         (2.0, 0),  # 2.0 or above = 0 (very high injury risk)
     ]
+    _REFERENCE_X, _REFERENCE_Y = zip(*REFERENCE_POINTS)
 
     def calculate_component(self, workout_data: List[Dict[str, any]]) -> Optional[int]:
         """
@@ -71,18 +74,38 @@ class ACWRCalculator:
             logger.debug("No workout data provided")
             return None
 
-        # Check for negative TSS values (invalid data)
+        # Extract TSS values once (treat None as 0 - rest day)
+        loads = []
         for entry in workout_data:
             tss = entry.get("training_stress_score")
-            if tss is not None and tss < 0:
-                logger.debug(f"Invalid negative TSS value: {tss}")
-                return None
+            loads.append(tss if tss is not None else 0)
+
+        return self.calculate_from_loads(loads)
+
+    def calculate_from_loads(self, loads: Sequence[float]) -> Optional[int]:
+        """
+        Calculate ACWR component score from per-workout TSS values.
+
+        Acute and chronic loads are averaged from the tail of the same
+        sequence, so the values are walked once per window rather than
+        re-extracted from the workout dicts for each.
+
+        Args:
+            loads: TSS values in date order (rest days as 0)
+
+        Returns:
+            Integer score 0-100, or None if insufficient data
+        """
+        # Check for negative TSS values (invalid data)
+        if any(tss < 0 for tss in loads):
+            logger.debug("Invalid negative TSS value")
+            return None
 
         # Calculate acute load (last 7 days average)
-        acute_load = self._calculate_acute_load(workout_data)
+        acute_load = self._average_tail(loads, self.ACUTE_DAYS)
 
         # Calculate chronic load (last 28 days average)
-        chronic_load = self._calculate_chronic_load(workout_data)
+        chronic_load = self._average_tail(loads, self.CHRONIC_DAYS)
 
         if acute_load is None or chronic_load is None:
             logger.debug("Insufficient data for ACWR calculation")
@@ -105,77 +128,22 @@ class ACWRCalculator:
 
         return score
 
-    def _calculate_acute_load(
-        self, workout_data: List[Dict[str, any]]
-    ) -> Optional[float]:
+    def _average_tail(self, loads: Sequence[float], days: int) -> Optional[float]:
         """
-        Calculate acute load (7-day average TSS).
+        Average the most recent ``days`` TSS values.
 
         Args:
-            workout_data: List of workout dicts
+            loads: TSS values in date order
+            days: Window length (7 for acute, 28 for chronic load)
 
         Returns:
-            Average TSS over last 7 days, or None if insufficient data
+            Average TSS over the window, or None if insufficient data
         """
-        # Get most recent 7 days of data
-        recent_data = (
-            workout_data[-self.ACUTE_DAYS :]
-            if len(workout_data) >= self.ACUTE_DAYS
-            else workout_data
-        )
-
-        if len(recent_data) < self.ACUTE_DAYS:
-            logger.debug(
-                f"Insufficient data for acute load: {len(recent_data)} < {self.ACUTE_DAYS}"
-            )
+        if len(loads) < days:
+            logger.debug(f"Insufficient data for {days}-day load: {len(loads)}")
             return None
 
-        # Extract TSS values (treat None as 0 - rest day)
-        tss_values = []
-        for entry in recent_data:
-            tss = entry.get("training_stress_score")
-            tss_values.append(tss if tss is not None else 0)
-
-        # Calculate average
-        avg_tss = sum(tss_values) / len(tss_values)
-
-        return avg_tss
-
-    def _calculate_chronic_load(
-        self, workout_data: List[Dict[str, any]]
-    ) -> Optional[float]:
-        """
-        Calculate chronic load (28-day average TSS).
-
-        Args:
-            workout_data: List of workout dicts
-
-        Returns:
-            Average TSS over last 28 days, or None if insufficient data
-        """
-        # Get most recent 28 days of data
-        recent_data = (
-            workout_data[-self.CHRONIC_DAYS :]
-            if len(workout_data) >= self.CHRONIC_DAYS
-            else workout_data
-        )
-
-        if len(recent_data) < self.CHRONIC_DAYS:
-            logger.debug(
-                f"Insufficient data for chronic load: {len(recent_data)} < {self.CHRONIC_DAYS}"
-            )
-            return None
-
-        # Extract TSS values (treat None as 0 - rest day)
-        tss_values = []
-        for entry in recent_data:
-            tss = entry.get("training_stress_score")
-            tss_values.append(tss if tss is not None else 0)
-
-        # Calculate average
-        avg_tss = sum(tss_values) / len(tss_values)
-
-        return avg_tss
+        return sum(loads[-days:]) / days
 
     def _interpolate_score(self, acwr: float) -> int:
         """
@@ -189,36 +157,4 @@ class ACWRCalculator:
         Returns:
             Integer score 0-100
         """
-        # Handle values beyond reference range
-        if acwr <= self.REFERENCE_POINTS[0][0]:
-            # At or below 0.5 = 30 (significant detraining)
-            return self.REFERENCE_POINTS[0][1]
-
-        if acwr >= self.REFERENCE_POINTS[-1][0]:
-            # At or above 2.0 = 0 (very high injury risk)
-            return self.REFERENCE_POINTS[-1][1]
-
-        # Find the two reference points to interpolate between
-        for i in range(len(self.REFERENCE_POINTS) - 1):
-            lower_acwr, lower_score = self.REFERENCE_POINTS[i]
-            upper_acwr, upper_score = self.REFERENCE_POINTS[i + 1]
-
-            if lower_acwr <= acwr <= upper_acwr:
-                # Special case: 0.8-1.3 all score 100 (sweet spot)
-                if lower_acwr == 0.8 and upper_acwr == 1.3:
-                    return 100
-
-                # Linear interpolation for other ranges
-                range_size = upper_acwr - lower_acwr
-                position = acwr - lower_acwr
-                fraction = position / range_size
-
-                # Interpolate score
-                score_range = upper_score - lower_score
-                score = lower_score + (score_range * fraction)
-
-                return int(round(score))
-
-        # Should never reach here due to bounds checking above
-        logger.warning(f"Unexpected ACWR value: {acwr:.2f}")
-        return 50  # Return neutral score as fallback
+        return interpolate_score(acwr, self._REFERENCE_X, self._REFERENCE_Y)
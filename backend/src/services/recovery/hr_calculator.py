@@ -19,6 +19,8 @@ Algorithm:
 from typing import List, Dict, Optional
 import logging
 
+from src.services.recovery.scoring import interpolate_score, recent_valid_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +41,7 @@ class HRCalculator:
         (5, 25),  # +5% above = 25 (elevated warning)
         (10, 0),  # +10% or more above = 0 (poor)
     ]
+    _REFERENCE_X, _REFERENCE_Y = zip(*REFERENCE_POINTS)
 
     def calculate_component(
         self, current_hr: Optional[int], historical_data: List[Dict[str, any]]
@@ -101,16 +104,10 @@ class HRCalculator:
         if not historical_data:
             return None
 
-        # Extract valid HR values (not None, most recent 7 days)
-        valid_values = []
-
-        for entry in historical_data:
-            hr_value = entry.get("resting_hr")
-            if hr_value is not None and hr_value > 0:
-                valid_values.append(hr_value)
-
-        # Take most recent 7 days
-        valid_values = valid_values[-self.ROLLING_WINDOW_DAYS :]
+        # Most recent 7 valid HR values (not None, positive)
+        valid_values = recent_valid_values(
+            historical_data, "resting_hr", self.ROLLING_WINDOW_DAYS
+        )
 
         # Need at least MIN_VALID_DAYS for reliable average
         if len(valid_values) < self.MIN_VALID_DAYS:
@@ -139,33 +136,4 @@ class HRCalculator:
         Returns:
             Integer score 0-100
         """
-        # Handle values beyond reference range
-        if deviation_pct <= self.REFERENCE_POINTS[0][0]:
-            # At or below -5% = 100 (cap at max)
-            return self.REFERENCE_POINTS[0][1]
-
-        if deviation_pct >= self.REFERENCE_POINTS[-1][0]:
-            # At or above +10% = 0 (floor at min)
-            return self.REFERENCE_POINTS[-1][1]
-
-        # Find the two reference points to interpolate between
-        for i in range(len(self.REFERENCE_POINTS) - 1):
-            lower_dev, lower_score = self.REFERENCE_POINTS[i]
-            upper_dev, upper_score = self.REFERENCE_POINTS[i + 1]
-
-            if lower_dev <= deviation_pct <= upper_dev:
-                # Linear interpolation
-                # Calculate position between lower and upper
-                range_size = upper_dev - lower_dev
-                position = deviation_pct - lower_dev
-                fraction = position / range_size
-
-                # Interpolate score
-                score_range = upper_score - lower_score
-                score = lower_score + (score_range * fraction)
-
-                return int(round(score))
-
-        # Should never reach here due to bounds checking above
-        logger.warning(f"Unexpected deviation value: {deviation_pct}%")
-        return 50  # Return neutral score as fallback
+        return interpolate_score(deviation_pct, self._REFERENCE_X, self._REFERENCE_Y)
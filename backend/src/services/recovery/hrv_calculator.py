@@ -18,6 +18,8 @@ Algorithm:
 from typing import List, Dict, Optional
 import logging
 
+from src.services.recovery.scoring import interpolate_score, recent_valid_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +39,7 @@ class HRVCalculator:
         (0, 50),  # At average = 50 (normal)
         (10, 100),  # +10% or more above = 100 (excellent)
     ]
+    _REFERENCE_X, _REFERENCE_Y = zip(*REFERENCE_POINTS)
 
     def calculate_component(
         self, current_hrv: Optional[int], historical_data: List[Dict[str, any]]
@@ -99,16 +102,10 @@ class HRVCalculator:
         if not historical_data:
             return None
 
-        # Extract valid HRV values (not None, most recent 7 days)
-        valid_values = []
-
-        for entry in historical_data:
-            hrv_value = entry.get("hrv_ms")
-            if hrv_value is not None and hrv_value > 0:
-                valid_values.append(hrv_value)
-
-        # Take most recent 7 days
-        valid_values = valid_values[-self.ROLLING_WINDOW_DAYS :]
+        # Most recent 7 valid HRV values (not None, positive)
+        valid_values = recent_valid_values(
+            historical_data, "hrv_ms", self.ROLLING_WINDOW_DAYS
+        )
 
         # Need at least MIN_VALID_DAYS for reliable average
         if len(valid_values) < self.MIN_VALID_DAYS:
@@ -135,33 +132,4 @@ class HRVCalculator:
         Returns:
             Integer score 0-100
         """
-        # Handle values beyond reference range
-        if deviation_pct >= self.REFERENCE_POINTS[-1][0]:
-            # At or above +10% = 100 (cap at max)
-            return self.REFERENCE_POINTS[-1][1]
-
-        if deviation_pct <= self.REFERENCE_POINTS[0][0]:
-            # At or below -20% = 0 (floor at min)
-            return self.REFERENCE_POINTS[0][1]
-
-        # Find the two reference points to interpolate between
-        for i in range(len(self.REFERENCE_POINTS) - 1):
-            lower_dev, lower_score = self.REFERENCE_POINTS[i]
-            upper_dev, upper_score = self.REFERENCE_POINTS[i + 1]
-
-            if lower_dev <= deviation_pct <= upper_dev:
-                # Linear interpolation
-                # Calculate position between lower and upper
-                range_size = upper_dev - lower_dev
-                position = deviation_pct - lower_dev
-                fraction = position / range_size
-
-                # Interpolate score
-                score_range = upper_score - lower_score
-                score = lower_score + (score_range * fraction)
-
-                return int(round(score))
-
-        # Should never reach here due to bounds checking above
-        logger.warning(f"Unexpected deviation value: {deviation_pct}%")
-        return 50  # Return neutral score as fallback
+        return interpolate_score(deviation_pct, self._REFERENCE_X, self._REFERENCE_Y)
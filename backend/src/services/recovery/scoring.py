@@ -0,0 +1,69 @@
+"""
+Shared scoring kernels for recovery component calculators.
+
+Each component maps a measurement (deviation %, hours, ratio) to a 0-100 score
+by linear interpolation between fixed reference points, clamped at both ends.
+The reference x-values are sorted, so the bracketing segment is found with a
+binary search instead of a linear scan over every segment.
+
+Baselines average the most recent valid readings, found by walking the history
+backwards and stopping once the window is full.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Sequence
+
+
+def interpolate_score(value: float, xs: Sequence[float], ys: Sequence[int]) -> int:
+    """
+    Interpolate a score from sorted reference points.
+
+    Args:
+        value: Measurement to score
+        xs: Reference measurements in ascending order
+        ys: Scores at each reference measurement
+
+    Returns:
+        Integer score, clamped to the first/last reference score outside the
+        reference range
+    """
+    if value <= xs[0]:
+        return ys[0]
+
+    if value >= xs[-1]:
+        return ys[-1]
+
+    # xs[i - 1] <= value < xs[i]
+    i = bisect_right(xs, value)
+    lower_x, upper_x = xs[i - 1], xs[i]
+    lower_y, upper_y = ys[i - 1], ys[i]
+
+    fraction = (value - lower_x) / (upper_x - lower_x)
+    return int(round(lower_y + (upper_y - lower_y) * fraction))
+
+
+def recent_valid_values(
+    historical_data: Sequence[Dict[str, Any]], key: str, window: int
+) -> List[float]:
+    """
+    Collect the most recent positive readings of ``key``.
+
+    Args:
+        historical_data: Rows in date order
+        key: Reading to collect (e.g. 'hrv_ms', 'resting_hr')
+        window: Maximum number of readings to return
+
+    Returns:
+        Up to ``window`` readings, oldest first; missing and non-positive
+        readings are skipped
+    """
+    values = []
+    for entry in reversed(historical_data):
+        value = entry.get(key)
+        if value is not None and value > 0:
+            values.append(value)
+            if len(values) == window:
+                break
+
+    values.reverse()
+    return values
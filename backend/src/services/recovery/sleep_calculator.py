@@ -24,6 +24,8 @@ Algorithm:
 from typing import Dict, Optional
 import logging
 
+from src.services.recovery.scoring import interpolate_score
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,7 @@ class SleepCalculator:
         (9, 100),  # 9 hours = 100 (optimal end)
         (10, 70),  # 10 hours = 70 (excessive)
     ]
+    _REFERENCE_X, _REFERENCE_Y = zip(*DURATION_REFERENCE_POINTS)
 
     def calculate_component(
         self, sleep_data: Optional[Dict[str, any]]
@@ -121,44 +124,12 @@ class SleepCalculator:
         Returns:
             Duration score 0-100
         """
-        # Handle values beyond reference range
-        if hours <= self.DURATION_REFERENCE_POINTS[0][0]:
-            # ≤4 hours = 0
-            return self.DURATION_REFERENCE_POINTS[0][1]
-
-        if hours >= self.DURATION_REFERENCE_POINTS[-1][0]:
-            # ≥10 hours = 70 (or continue declining)
-            # For very excessive sleep (>10h), continue declining
-            if hours > 10:
-                # Decline linearly: 10h=70, 12h=50, 14h=30, 16h=0
-                # Every 2 hours past 10 loses 20 points
-                excess_hours = hours - 10
-                penalty = (excess_hours / 2) * 20
-                score = max(0, 70 - penalty)
-                return int(round(score))
-            return self.DURATION_REFERENCE_POINTS[-1][1]
-
-        # Find the two reference points to interpolate between
-        for i in range(len(self.DURATION_REFERENCE_POINTS) - 1):
-            lower_hours, lower_score = self.DURATION_REFERENCE_POINTS[i]
-            upper_hours, upper_score = self.DURATION_REFERENCE_POINTS[i + 1]
-
-            if lower_hours <= hours <= upper_hours:
-                # Special case: 7-9 hours all score 100 (optimal range)
-                if lower_hours == 7 and upper_hours == 9:
-                    return 100
-
-                # Linear interpolation for other ranges
-                range_size = upper_hours - lower_hours
-                position = hours - lower_hours
-                fraction = position / range_size
-
-                # Interpolate score
-                score_range = upper_score - lower_score
-                score = lower_score + (score_range * fraction)
-
-                return int(round(score))
-
-        # Should never reach here due to bounds checking above
-        logger.warning(f"Unexpected sleep duration: {hours}h")
-        return 50  # Return neutral score as fallback
+        # For very excessive sleep (>10h), keep declining past the last point:
+        # 10h=70, 12h=50, 14h=30, 16h=0 (every 2 hours past 10 loses 20 points)
+        if hours > self.DURATION_REFERENCE_POINTS[-1][0]:
+            excess_hours = hours - 10
+            penalty = (excess_hours / 2) * 20
+            score = max(0, 70 - penalty)
+            return int(round(score))
+
+        return interpolate_score(hours, self._REFERENCE_X, self._REFERENCE_Y)
@@ -1,25 +1,44 @@
 """Encryption utilities for sensitive data like tokens."""
 
+import base64
+import os
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from src.config.settings import get_settings
 
+# Marks ciphertexts produced with AES-GCM; anything else is legacy Fernet
+_AESGCM_PREFIX = "v2:"
+_NONCE_SIZE = 12
+
 
 class EncryptionService:
-    """Service for encrypting and decrypting sensitive data."""
+    """Service for encrypting and decrypting sensitive data.
+
+    New values are sealed with AES-256-GCM under a key derived once (HKDF)
+    at construction. Values written by the previous Fernet scheme are still
+    decrypted so existing stored tokens keep working.
+    """
 
     def __init__(self):
         """Initialize encryption service with settings."""
         settings = get_settings()
-        # In production, this should be loaded from environment variable
-        # For now, generate a key if not set
-        key = settings.jwt_secret_key.encode()[:32]  # Use first 32 bytes
-        # Pad to 32 bytes if needed
-        if len(key) < 32:
-            key = key + b"0" * (32 - len(key))
-        # Fernet requires base64 encoded 32-byte key
-        import base64
+        secret = settings.token_encryption_key or settings.jwt_secret_key
 
-        self.cipher = Fernet(base64.urlsafe_b64encode(key))
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"ai-trainer token encryption",
+        ).derive(secret.encode())
+        self.aead = AESGCM(key)
+
+        # Legacy Fernet key: first 32 bytes of the JWT secret, zero padded
+        legacy_key = settings.jwt_secret_key.encode()[:32].ljust(32, b"0")
+        self.legacy_cipher = Fernet(base64.urlsafe_b64encode(legacy_key))
 
     def encrypt(self, data: str) -> str:
         """Encrypt a string.
@@ -30,8 +49,9 @@ class EncryptionService:
         Returns:
             Encrypted string
         """
-        encrypted_bytes = self.cipher.encrypt(data.encode())
-        return encrypted_bytes.decode()
+        nonce = os.urandom(_NONCE_SIZE)
+        sealed = nonce + self.aead.encrypt(nonce, data.encode(), None)
+        return _AESGCM_PREFIX + base64.urlsafe_b64encode(sealed).decode()
 
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt an encrypted string.
@@ -43,9 +63,15 @@ class EncryptionService:
             Decrypted plain text string
 
         Raises:
-            cryptography.fernet.InvalidToken: If decryption fails
+            cryptography.exceptions.InvalidTag: If AES-GCM decryption fails
+            cryptography.fernet.InvalidToken: If legacy decryption fails
         """
-        decrypted_bytes = self.cipher.decrypt(encrypted_data.encode())
+        if encrypted_data.startswith(_AESGCM_PREFIX):
+            sealed = base64.urlsafe_b64decode(encrypted_data[len(_AESGCM_PREFIX) :])
+            nonce, ciphertext = sealed[:_NONCE_SIZE], sealed[_NONCE_SIZE:]
+            return self.aead.decrypt(nonce, ciphertext, None).decode()
+
+        decrypted_bytes = self.legacy_cipher.decrypt(encrypted_data.encode())
         return decrypted_bytes.decode()
 
 
@@ -66,10 +92,23 @@ def encrypt_token(token: str) -> str:
     return _encryption_service.encrypt(token)
 
 
+@lru_cache(maxsize=1024)
+def _decrypt_cached(encrypted_token: str) -> str:
+    """Decrypt a token, memoized on its ciphertext.
+
+    Every encryption uses a fresh nonce, so a rotated token has a new
+    ciphertext and simply misses the cache; no explicit invalidation needed.
+    """
+    return _encryption_service.decrypt(encrypted_token)
+
+
 def decrypt_token(encrypted_token: str) -> str:
     """
     Decrypt an encrypted token string.
 
+    Results are cached per process, so workers syncing the same user
+    repeatedly skip the decryption.
+
     Args:
         encrypted_token: Encrypted token
 
@@ -77,6 +116,7 @@ def decrypt_token(encrypted_token: str) -> str:
         Decrypted plain text token
 
     Raises:
-        cryptography.fernet.InvalidToken: If decryption fails
+        cryptography.exceptions.InvalidTag: If AES-GCM decryption fails
+        cryptography.fernet.InvalidToken: If legacy decryption fails
     """
-    return _encryption_service.decrypt(encrypted_token)
+    return _decrypt_cached(encrypted_token)
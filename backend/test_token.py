@@ -1,7 +1,7 @@
 """Test JWT token verification."""
 import os
 from dotenv import load_dotenv
-from jose import jwt
+import jwt
 
 # Load .env file
 load_dotenv()
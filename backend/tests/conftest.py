@@ -1,18 +1,23 @@
 """Pytest fixtures for database and Redis."""
 
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
 from unittest.mock import Mock
 
-import pytest
-import pytest_asyncio
-from httpx import AsyncClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool, StaticPool
+# Select test settings before src modules read them (enables the raiseload
+# guard in src.database.connection)
+os.environ.setdefault("ENVIRONMENT", "test")
 
-from src.database.connection import Base, get_db, get_sync_db_session
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from httpx import AsyncClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker, Session  # noqa: E402
+from sqlalchemy.pool import NullPool, StaticPool  # noqa: E402
+
+from src.database.connection import Base, get_db, get_sync_db_session  # noqa: E402
 
 try:
     from redis.asyncio import Redis
@@ -0,0 +1,145 @@
+"""Unit tests for JWT authentication middleware."""
+
+import time
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, Mock, patch
+
+import pytest
+import jwt
+from jwt import InvalidTokenError
+
+from src.api.middleware.auth import (
+    JWTBearer,
+    _JWT_ALG,
+    _JWT_SECRET,
+    _decode_cached,
+    _user_cache,
+    get_current_user,
+    invalidate_cached_user,
+)
+from src.models.user import User
+
+
+@pytest.fixture
+def bearer():
+    """Create a JWT bearer instance."""
+    _decode_cached.cache_clear()
+    return JWTBearer()
+
+
+def _make_token(exp: float) -> str:
+    """Encode a token signed with the middleware's key."""
+    return jwt.encode(
+        {"sub": "user-123", "exp": int(exp)}, _JWT_SECRET, algorithm=_JWT_ALG
+    )
+
+
+class TestJWTBearerDecode:
+    """Test cached JWT decoding in JWTBearer."""
+
+    def test_decode_valid_token(self, bearer):
+        """Test decoding a valid token returns its payload."""
+        token = _make_token(time.time() + 60)
+
+        payload = bearer.decode_jwt(token)
+
+        assert payload["sub"] == "user-123"
+
+    def test_repeat_decode_verifies_signature_once(self, bearer):
+        """Test that decoding the same token twice only verifies it once."""
+        token = _make_token(time.time() + 60)
+
+        with patch(
+            "src.api.middleware.auth.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            bearer.decode_jwt(token)
+            bearer.decode_jwt(token)
+
+        assert mock_decode.call_count == 1
+
+    def test_payload_edits_do_not_reach_cache(self, bearer):
+        """Test that editing a decoded payload leaves later decodes unchanged."""
+        token = _make_token(time.time() + 60)
+
+        payload = bearer.decode_jwt(token)
+        payload.pop("sub")
+        payload["role"] = "admin"
+
+        assert bearer.decode_jwt(token) == {"sub": "user-123", "exp": ANY}
+
+    def test_cached_token_still_expires(self, bearer):
+        """Test that a cached payload is rejected once the token expires."""
+        token = _make_token(time.time() + 60)
+        assert bearer.decode_jwt(token) is not None
+
+        with patch("src.api.middleware.auth.time.time", return_value=time.time() + 120):
+            with pytest.raises(jwt.ExpiredSignatureError):
+                bearer._decode(token)
+            assert bearer.decode_jwt(token) is None
+
+    def test_invalid_token_returns_none(self, bearer):
+        """Test that an invalid token is not decoded."""
+        assert bearer.decode_jwt("invalid.token.here") is None
+
+        with pytest.raises(InvalidTokenError):
+            bearer._decode("invalid.token.here")
+
+
+@pytest.fixture
+def mock_db():
+    """Patch the async session factory with a mock session."""
+    _user_cache.clear()
+    db = Mock()
+    db.get = AsyncMock()
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    with patch("src.api.middleware.auth.AsyncSessionLocal", session):
+        yield db
+
+
+class TestGetCurrentUserCache:
+    """Test the short-lived user cache in get_current_user."""
+
+    def _request(self, user_id: uuid.UUID):
+        return SimpleNamespace(state=SimpleNamespace(user_id=str(user_id)))
+
+    async def test_repeat_requests_hit_database_once(self, mock_db):
+        """Test that a cached user is served without a second query."""
+        user_id = uuid.uuid4()
+        mock_db.get.return_value = User(id=user_id, email="test@example.com")
+
+        first = await get_current_user(self._request(user_id), credentials=Mock())
+        second = await get_current_user(self._request(user_id), credentials=Mock())
+
+        assert first is second
+        mock_db.get.assert_awaited_once_with(User, user_id)
+
+    async def test_invalidate_forces_reload(self, mock_db):
+        """Test that invalidating a user forces a fresh query."""
+        user_id = uuid.uuid4()
+        mock_db.get.return_value = User(id=user_id, email="test@example.com")
+
+        await get_current_user(self._request(user_id), credentials=Mock())
+        invalidate_cached_user(user_id)
+        await get_current_user(self._request(user_id), credentials=Mock())
+
+        assert mock_db.get.call_count == 2
+
+    async def test_expired_entry_is_reloaded(self, mock_db):
+        """Test that entries older than the TTL are not served."""
+        user_id = uuid.uuid4()
+        mock_db.get.return_value = User(id=user_id, email="test@example.com")
+
+        await get_current_user(self._request(user_id), credentials=Mock())
+        with patch(
+            "src.api.middleware.auth.time.monotonic",
+            return_value=time.monotonic() + 3600,
+        ):
+            await get_current_user(self._request(user_id), credentials=Mock())
+
+        assert mock_db.get.call_count == 2
@@ -0,0 +1,71 @@
+"""Unit tests for token encryption utilities."""
+
+import base64
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from src.utils.encryption import (
+    EncryptionService,
+    _decrypt_cached,
+    decrypt_token,
+    encrypt_token,
+)
+
+
+@pytest.fixture
+def encryption_service():
+    """Create an encryption service instance."""
+    return EncryptionService()
+
+
+class TestEncryptionService:
+    """Test AES-GCM token encryption and legacy Fernet decryption."""
+
+    def test_round_trip(self, encryption_service):
+        """Test that an encrypted token decrypts to the original value."""
+        encrypted = encryption_service.encrypt("garmin-access-token")
+
+        assert encrypted != "garmin-access-token"
+        assert encryption_service.decrypt(encrypted) == "garmin-access-token"
+
+    def test_encrypt_uses_fresh_nonce(self, encryption_service):
+        """Test that encrypting the same value twice gives different output."""
+        first = encryption_service.encrypt("token")
+        second = encryption_service.encrypt("token")
+
+        assert first != second
+        assert first.startswith("v2:")
+
+    def test_decrypts_legacy_fernet_tokens(self, encryption_service):
+        """Test that tokens stored before the AES-GCM switch still decrypt."""
+        legacy = encryption_service.legacy_cipher.encrypt(b"old-token").decode()
+
+        assert encryption_service.decrypt(legacy) == "old-token"
+
+    def test_tampered_token_rejected(self, encryption_service):
+        """Test that a modified ciphertext fails authentication."""
+        encrypted = encryption_service.encrypt("token")
+        sealed = bytearray(base64.urlsafe_b64decode(encrypted[3:]))
+        sealed[-1] ^= 0x01
+        tampered = "v2:" + base64.urlsafe_b64encode(bytes(sealed)).decode()
+
+        with pytest.raises(InvalidTag):
+            encryption_service.decrypt(tampered)
+
+    def test_module_helpers(self):
+        """Test the module-level encrypt/decrypt helpers."""
+        assert decrypt_token(encrypt_token("token")) == "token"
+
+    def test_decrypt_token_is_cached_per_ciphertext(self):
+        """Test that repeated decrypts of one ciphertext hit the cache."""
+        _decrypt_cached.cache_clear()
+        encrypted = encrypt_token("token")
+
+        decrypt_token(encrypted)
+        decrypt_token(encrypted)
+        decrypt_token(encrypt_token("token"))
+
+        info = _decrypt_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
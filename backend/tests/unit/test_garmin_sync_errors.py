@@ -0,0 +1,94 @@
+"""
+Unit tests for Garmin sync retry classification and concurrency.
+
+Only transient failures should be retried by Celery; bad tokens and client
+errors must fail the task straight away. Each sync runs its own event loop, so
+overlapping syncs on separate worker threads must not interfere.
+"""
+
+import asyncio
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from src.jobs.garmin_sync import (
+    PermanentGarminError,
+    TransientGarminError,
+    _classify_sync_error,
+    sync_user_garmin_data,
+)
+from src.services.garmin.health_service import (
+    GarminAPIError,
+    GarminRateLimitError,
+    GarminUnauthorizedError,
+)
+
+
+def _api_error(status_code: int) -> GarminAPIError:
+    """Build a GarminAPIError caused by an HTTP status error."""
+    request = httpx.Request("GET", "https://apis.garmin.com/wellness-api/rest")
+    response = httpx.Response(status_code, request=request)
+    cause = httpx.HTTPStatusError("error", request=request, response=response)
+    error = GarminAPIError(f"HTTP {status_code}")
+    error.__cause__ = cause
+    return error
+
+
+class TestClassifySyncError:
+    """Test mapping of sync exceptions to retry categories."""
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            GarminRateLimitError("rate limited"),
+            httpx.ConnectError("connection refused"),
+            _api_error(503),
+        ],
+    )
+    def test_transient_errors(self, exc):
+        """Test that rate limits, network and server errors are retried."""
+        assert isinstance(_classify_sync_error(exc), TransientGarminError)
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            GarminUnauthorizedError("token expired"),
+            InvalidTag(),
+            _api_error(400),
+            ValueError("unexpected"),
+        ],
+    )
+    def test_permanent_errors(self, exc):
+        """Test that auth, decrypt, client and unknown errors are not retried."""
+        assert isinstance(_classify_sync_error(exc), PermanentGarminError)
+
+
+class TestConcurrentSyncs:
+    """Test that syncs on separate worker threads run their own event loops."""
+
+    def test_two_syncs_run_at_the_same_time(self):
+        """Test that two overlapping syncs both complete."""
+        # Both loops must be running at once for the barrier to release
+        barrier = threading.Barrier(2)
+
+        async def fake_sync_all(user_id, target_date):
+            await asyncio.to_thread(barrier.wait, 5)
+            return {"status": "success", "user_id": str(user_id)}
+
+        user_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        with patch("src.jobs.garmin_sync._sync_all", fake_sync_all):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(
+                    pool.map(
+                        lambda user_id: sync_user_garmin_data(user_id, "2026-10-15"),
+                        user_ids,
+                    )
+                )
+
+        assert [result["user_id"] for result in results] == user_ids
+        assert all(result["status"] == "success" for result in results)
@@ -3,7 +3,8 @@
 import pytest
 import uuid
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError
 
 from src.services.jwt_service import JWTService
 from src.config.settings import get_settings
@@ -142,14 +143,14 @@ class TestJWTService:
             user_id=test_user_id, expires_delta=timedelta(seconds=-1)
         )
 
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             jwt_service.verify_token(token, expected_type="access")
 
     def test_verify_invalid_token(self, jwt_service):
         """Test that verifying an invalid token fails."""
         invalid_token = "invalid.token.here"
 
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             jwt_service.verify_token(invalid_token, expected_type="access")
 
     def test_verify_tampered_token(self, jwt_service, test_user_id):
@@ -159,7 +160,7 @@ class TestJWTService:
         # Tamper with the token by changing a character
         tampered_token = token[:-10] + "X" + token[-9:]
 
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             jwt_service.verify_token(tampered_token, expected_type="access")
 
     def test_get_user_id_from_token(self, jwt_service, test_user_id):
@@ -0,0 +1,57 @@
+"""Unit tests for password hashing service."""
+
+import pytest
+from passlib.context import CryptContext
+
+from src.services.password_service import PasswordService
+
+
+@pytest.fixture
+def password_service():
+    """Create a password service instance."""
+    return PasswordService()
+
+
+@pytest.fixture
+def bcrypt_hash():
+    """Hash of "correct-password" in the legacy bcrypt format."""
+    return CryptContext(schemes=["bcrypt"]).hash("correct-password")
+
+
+class TestPasswordService:
+    """Test password hashing, verification and rehashing."""
+
+    def test_hash_uses_argon2id(self, password_service):
+        """Test that new hashes are Argon2id."""
+        hashed = password_service.hash_password("correct-password")
+
+        assert hashed.startswith("$argon2id$")
+        assert password_service.verify_password("correct-password", hashed)
+
+    def test_verify_and_update_current_hash(self, password_service):
+        """Test that a current hash verifies without a replacement."""
+        hashed = password_service.hash_password("correct-password")
+
+        valid, new_hash = password_service.verify_and_update("correct-password", hashed)
+
+        assert valid is True
+        assert new_hash is None
+
+    def test_verify_and_update_rehashes_bcrypt(self, password_service, bcrypt_hash):
+        """Test that a legacy bcrypt hash is replaced with Argon2id."""
+        valid, new_hash = password_service.verify_and_update(
+            "correct-password", bcrypt_hash
+        )
+
+        assert valid is True
+        assert new_hash.startswith("$argon2id$")
+        assert password_service.verify_password("correct-password", new_hash)
+
+    def test_verify_and_update_wrong_password(self, password_service, bcrypt_hash):
+        """Test that a wrong password is rejected and not rehashed."""
+        valid, new_hash = password_service.verify_and_update(
+            "wrong-password", bcrypt_hash
+        )
+
+        assert valid is False
+        assert new_hash is None
@@ -0,0 +1,185 @@
+"""
+Unit tests for the GET /recovery/{date} response cache.
+
+Response bodies are cached in Redis under a per-score version; the recovery
+job bumps the version and deletes the body after writing a new score, so the
+API never caches a score that was rewritten while it was being read.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import orjson
+import pytest
+
+import src.api.routes.recovery as recovery_routes
+from src.api.routes.recovery import get_recovery_score
+from src.jobs.recovery_score import (
+    _invalidate_cached_response,
+    recovery_score_cache_key,
+    recovery_score_version_key,
+)
+
+TARGET_DATE = date(2026, 10, 16)
+
+
+class _FakeScript:
+    """Python stand-in for the cache-if-current Lua script."""
+
+    async def __call__(self, keys, args, client):
+        cache_key, version_key = keys
+        version, body, ttl = args
+        if client.store.get(version_key, "") != version:
+            return 0
+        client.store[cache_key] = body
+        client.ttls[cache_key] = ttl
+        return 1
+
+
+class _FakePipeline:
+    """Queues commands and applies them on execute, like a MULTI block."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    def execute(self):
+        for name, key, *args in self.commands:
+            if name == "incr":
+                self.redis.store[key] = str(int(self.redis.store.get(key, 0)) + 1)
+            elif name == "expire":
+                self.redis.ttls[key] = args[0]
+            else:
+                self.redis.store.pop(key, None)
+
+
+class _FakeRedis:
+    """In-memory Redis exposing the async calls the route makes and the sync
+    pipeline the job uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def register_script(self, script):
+        return _FakeScript()
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis():
+    """Share one fake Redis between the route and the recovery job."""
+    redis = _FakeRedis()
+    recovery_routes._cache_if_current_script = None
+    with patch("src.jobs.recovery_score.get_sync_redis", return_value=redis):
+        yield redis
+    recovery_routes._cache_if_current_script = None
+
+
+@pytest.fixture
+def user():
+    """Current user for the route."""
+    return SimpleNamespace(id=uuid.uuid4())
+
+
+def _score_row(score: int) -> SimpleNamespace:
+    """Build a fresh recovery score row as selected by the route."""
+    cached_at = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        date=TARGET_DATE,
+        overall_score=score,
+        status="green",
+        hrv_score=80,
+        hr_score=75,
+        sleep_score=70,
+        acwr_score=65,
+        explanation="Good recovery",
+        cached_at=cached_at,
+        cache_expires_at=cached_at + timedelta(hours=24),
+    )
+
+
+def _mock_db(row: SimpleNamespace) -> Mock:
+    """Mock session whose execute returns ``row``."""
+    db = Mock()
+    db.execute = AsyncMock(return_value=Mock(first=Mock(return_value=row)))
+    return db
+
+
+async def _get(user, db, redis) -> dict:
+    """Call the route and decode its JSON body."""
+    response = await get_recovery_score(
+        date=TARGET_DATE.isoformat(), current_user=user, db=db, redis=redis
+    )
+    return orjson.loads(response.body)
+
+
+class TestRecoveryResponseCache:
+    """Test caching and invalidation of recovery score responses."""
+
+    async def test_miss_queries_and_caches(self, fake_redis, user):
+        """Test that a miss reads the database and caches the body."""
+        db = _mock_db(_score_row(82))
+
+        body = await _get(user, db, fake_redis)
+
+        assert body["overall_score"] == 82
+        assert body["is_expired"] is False
+        db.execute.assert_awaited_once()
+        cache_key = recovery_score_cache_key(user.id, TARGET_DATE)
+        assert orjson.loads(fake_redis.store[cache_key]) == body
+        assert 0 < fake_redis.ttls[cache_key] <= 86400
+
+    async def test_hit_skips_database(self, fake_redis, user):
+        """Test that a cached body is served without a query."""
+        db = _mock_db(_score_row(82))
+
+        first = await _get(user, db, fake_redis)
+        second = await _get(user, db, fake_redis)
+
+        assert second == first
+        db.execute.assert_awaited_once()
+
+    async def test_job_invalidation_forces_reload(self, fake_redis, user):
+        """Test that a score rewritten by the job is read fresh."""
+        await _get(user, _mock_db(_score_row(82)), fake_redis)
+
+        _invalidate_cached_response(user.id, TARGET_DATE)
+        assert recovery_score_cache_key(user.id, TARGET_DATE) not in fake_redis.store
+
+        body = await _get(user, _mock_db(_score_row(45)), fake_redis)
+
+        assert body["overall_score"] == 45
+
+    async def test_rewrite_during_read_is_not_cached(self, fake_redis, user):
+        """Test that a body read before a concurrent rewrite is not cached."""
+        db = _mock_db(_score_row(82))
+        select_result = db.execute.return_value
+
+        async def select_then_job_commits(*args, **kwargs):
+            _invalidate_cached_response(user.id, TARGET_DATE)
+            return select_result
+
+        db.execute.side_effect = select_then_job_commits
+
+        body = await _get(user, db, fake_redis)
+
+        assert body["overall_score"] == 82
+        assert recovery_score_cache_key(user.id, TARGET_DATE) not in fake_redis.store
+        assert fake_redis.store[recovery_score_version_key(user.id, TARGET_DATE)] == "1"
@@ -0,0 +1,55 @@
+"""
+Unit tests for the shared recovery scoring kernels.
+
+interpolate_score maps a measurement onto sorted reference points with linear
+interpolation, clamping to the end scores outside the reference range.
+recent_valid_values collects the readings a rolling baseline averages.
+"""
+
+import pytest
+
+from src.services.recovery.scoring import interpolate_score, recent_valid_values
+
+XS = (-20, -10, 0, 10)
+YS = (0, 25, 50, 100)
+
+
+class TestInterpolateScore:
+    """Test piecewise-linear score interpolation."""
+
+    @pytest.mark.parametrize(
+        "value, expected", [(-50, 0), (-20, 0), (10, 100), (40, 100)]
+    )
+    def test_clamps_outside_reference_range(self, value, expected):
+        """Test that values at or beyond the end points return the end scores."""
+        assert interpolate_score(value, XS, YS) == expected
+
+    @pytest.mark.parametrize("value, expected", [(-10, 25), (0, 50)])
+    def test_reference_points_score_exactly(self, value, expected):
+        """Test that interior reference points return their own score."""
+        assert interpolate_score(value, XS, YS) == expected
+
+    def test_interpolates_within_segment(self):
+        """Test linear interpolation between neighbouring reference points."""
+        assert interpolate_score(-15, XS, YS) == 12
+        assert interpolate_score(5, XS, YS) == 75
+
+    def test_flat_segment(self):
+        """Test that a segment with equal end scores stays flat."""
+        assert interpolate_score(1.0, (0.5, 0.8, 1.3, 1.5), (30, 100, 100, 30)) == 100
+
+
+class TestRecentValidValues:
+    """Test collection of the most recent valid baseline readings."""
+
+    def test_keeps_most_recent_window_in_order(self):
+        """Test that only the last `window` readings are kept, oldest first."""
+        data = [{"hrv_ms": value} for value in range(1, 11)]
+
+        assert recent_valid_values(data, "hrv_ms", 7) == [4, 5, 6, 7, 8, 9, 10]
+
+    def test_skips_missing_and_non_positive_readings(self):
+        """Test that None, zero and missing readings do not fill the window."""
+        data = [{"hrv_ms": 50}, {"hrv_ms": None}, {"hrv_ms": 0}, {}, {"hrv_ms": 60}]
+
+        assert recent_valid_values(data, "hrv_ms", 7) == [50, 60]
@@ -3,6 +3,8 @@
 import uuid
 from datetime import datetime, timedelta
 
+from sqlalchemy.dialects import postgresql
+
 from src.models.user import User
 
 
@@ -98,6 +100,14 @@ class TestUserModel:
 
         assert user.is_garmin_connected is False
 
+    def test_is_garmin_connected_sql_expression(self):
+        """Test is_garmin_connected compiles to a SQL predicate on the class."""
+        sql = str(User.is_garmin_connected.compile(dialect=postgresql.dialect()))
+
+        assert "users.garmin_user_id IS NOT NULL" in sql
+        assert "users.garmin_access_token IS NOT NULL" in sql
+        assert "users.garmin_token_expires_at > now()" in sql
+
     def test_user_repr(self):
         """Test User string representation."""
         user_id = uuid.uuid4()